@@ -11,7 +11,6 @@ import logging
 import os
 import queue
 import threading
-from collections import deque
 import configparser
 import math
 import json
@@ -27,6 +26,10 @@ warnings.filterwarnings("ignore", category=Image.DecompressionBombWarning)
 # Add path for awos_assit_code
 sys.path.append(os.path.join(os.path.dirname(__file__), 'awos_assit_code'))
 
+# Upper-case names for the day/date displays, indexed by weekday() and month - 1
+_WEEKDAYS_UPPER = ('MONDAY', 'TUESDAY', 'WEDNESDAY', 'THURSDAY', 'FRIDAY', 'SATURDAY', 'SUNDAY')
+_MONTHS_UPPER = ('JAN', 'FEB', 'MAR', 'APR', 'MAY', 'JUN', 'JUL', 'AUG', 'SEP', 'OCT', 'NOV', 'DEC')
+
 class WeatherStationSystem:
     def __init__(self, root: tk.Tk) -> None:
         """Initialize the WeatherStationSystem with dual GUI support."""
@@ -223,7 +226,6 @@ class WeatherStationSystem:
             'timestamp': None
         }
         self.data_queue = queue.Queue()
-        self.log_buffer = deque(maxlen=self.config['logging']['max_log_entries'])
         self.last_rain_value = 0
         self.no_rain_counter = 0
         self.rain_reset_threshold = self.config['gui']['rain_reset_threshold']
@@ -1010,9 +1012,9 @@ class WeatherStationSystem:
         """Get formatted date/time information."""
         now = datetime.now()
         return {
-            'day': now.strftime('%A').upper(),
-            'date': now.strftime('%d %b').replace(now.strftime('%b'), now.strftime('%b').upper()) + now.strftime(' %Y'),
-            'time': now.strftime('%H:%M')
+            'day': _WEEKDAYS_UPPER[now.weekday()],
+            'date': f"{now.day:02d} {_MONTHS_UPPER[now.month - 1]} {now.year}",
+            'time': f"{now.hour:02d}:{now.minute:02d}"
         }
 
     def get_sun_info(self) -> dict:
@@ -1,4 +1,5 @@
 #!/usr/bin/env python3
+import bisect
 import csv
 import tkinter as tk
 from tkinter import ttk
@@ -9,15 +10,13 @@ import time
 from datetime import datetime
 import logging
 import os
-import queue
+import re
 import threading
-from collections import deque
 import configparser
 import math
 import json
 from logging.handlers import RotatingFileHandler
 import sys
-import pandas as pd
 
 # Disable DecompressionBombWarning
 Image.MAX_IMAGE_PIXELS = None
@@ -26,11 +25,149 @@ warnings.filterwarnings("ignore", category=Image.DecompressionBombWarning)
 # Add path for awos_assit_code
 sys.path.append(os.path.join(os.path.dirname(__file__), 'awos_assit_code'))
 
+# Per-register divisors for each Modbus payload, in register order
+ENVIRONMENT_DIVISORS = (10.0, 10.0, 10.0)  # temperature, humidity, pressure
+UV_DIVISORS = (100.0,)
+WIND_SPEED_DIVISORS = (10.0,)
+RAINFALL_DIVISORS = (10.0,)
+
+# Dated log/CSV filenames produced by setup_logging and csv_writer_loop
+LOG_FILE_PATTERN = re.compile(r'weather_station_(\d{4}-\d{2}-\d{2})\.log')
+CSV_FILE_PATTERN = re.compile(r'weather_data_(\d{4}-\d{2}-\d{2})\.csv')
+
+# Matches csv.writer's default terminator so rows stay consistent with older files
+CSV_LINE_TERMINATOR = '\r\n'
+
+# Upper-case display names indexed by tm_wday / tm_mon - 1 (what strftime('%A'/'%b').upper() gave)
+DAY_NAMES = ('MONDAY', 'TUESDAY', 'WEDNESDAY', 'THURSDAY', 'FRIDAY', 'SATURDAY', 'SUNDAY')
+MONTH_NAMES = ('JAN', 'FEB', 'MAR', 'APR', 'MAY', 'JUN', 'JUL', 'AUG', 'SEP', 'OCT', 'NOV', 'DEC')
+
+def format_csv_row(values):
+    """Join plain CSV fields (never quoted: no commas/quotes in our data) into one line"""
+    return ','.join('' if v is None else str(v) for v in values) + CSV_LINE_TERMINATOR
+
+# EPA PM2.5 -> AQI: segment upper bounds, then (conc low, AQI low, AQI high)
+PM25_BP_HI = (12.0, 35.4, 55.4, 150.4, 250.4, 500.4)
+PM25_SEGMENTS = (
+    (0.0, 0, 50),
+    (12.1, 51, 100),
+    (35.5, 101, 150),
+    (55.5, 151, 200),
+    (150.5, 201, 300),
+    (250.5, 301, 500)
+)
+PM25_LAST_SEGMENT = len(PM25_BP_HI) - 1
+
+def aqi_from_pm25(pm2_5):
+    """Piecewise-linear US EPA AQI for a PM2.5 concentration (float in, float out)"""
+    i = bisect.bisect_left(PM25_BP_HI, pm2_5)
+    if i > PM25_LAST_SEGMENT:
+        i = PM25_LAST_SEGMENT  # Extrapolate the top segment past 500.4
+    bp_lo, aqi_lo, aqi_hi = PM25_SEGMENTS[i]
+    return (pm2_5 - bp_lo) / (PM25_BP_HI[i] - bp_lo) * (aqi_hi - aqi_lo) + aqi_lo
+
+def scale_registers(registers, divisors):
+    """Scale a register payload in one pass using per-register divisors"""
+    return tuple(reg / div for reg, div in zip(registers, divisors))
+
+class SpscRing:
+    """Fixed-size single-producer/single-consumer ring for handing rows to the CSV writer
+
+    Only the producer advances head and only the consumer advances tail, so no
+    lock is needed; the event just wakes the consumer instead of polling. When
+    the consumer falls behind, the producer overwrites the oldest rows and the
+    consumer skips them. One slot is kept spare so a slot being overwritten is
+    never handed out.
+    """
+    __slots__ = ('buf', 'mask', 'head', 'tail', 'ready')
+
+    def __init__(self, capacity):
+        size = 1
+        while size <= capacity:  # Holds at least `capacity` items plus the spare slot
+            size <<= 1
+        self.buf = [None] * size
+        self.mask = size - 1
+        self.head = 0
+        self.tail = 0
+        self.ready = threading.Event()
+
+    def push(self, item):
+        """Append an item (producer side); returns False if it displaced the oldest one"""
+        overwrote = self.head - self.tail >= self.mask
+        self.buf[self.head & self.mask] = item
+        self.head += 1  # Publish only after the slot is filled
+        self.ready.set()
+        return not overwrote
+
+    def drain(self):
+        """Remove and return all queued items in order (consumer side)"""
+        buf, mask = self.buf, self.mask
+        head = self.head
+        start = max(self.tail, head - mask)  # Skip rows already displaced
+        items = [buf[i & mask] for i in range(start, head)]
+        # Drop any the producer lapped while we copied
+        first_valid = self.head - mask
+        if first_valid > start:
+            items = items[first_valid - start:]
+        self.tail = head
+        return items
+
+    def wait(self, timeout):
+        """Block until the producer signals or the timeout expires"""
+        self.ready.wait(timeout)
+        # Clear before draining so a push that lands after the drain re-arms the event
+        self.ready.clear()
+
+    def wake(self):
+        """Wake the consumer without queuing anything (used at shutdown)"""
+        self.ready.set()
+
 class WeatherStationSystem:
+    # Column order of the daily weather CSV (also the sensor_data keys written to it)
+    CSV_FIELDS = (
+        'timestamp', 'temperature', 'humidity', 'pressure', 'uv_index',
+        'co2', 'formaldehyde', 'tvoc', 'pm2_5', 'pm10',
+        'aqi_temperature', 'aqi_humidity',
+        'wind_speed', 'wind_dir_degrees', 'wind_dir_cardinal',
+        'rainfall'
+    )
+
+    # Upper bound (inclusive) of each state band; values above the last bound use the final state
+    AQI_THRESHOLDS = (50, 100, 150, 200, 300)
+    AQI_STATES = (
+        ("GOOD", "#00E400"),
+        ("MODERATE", "#FFFF00"),
+        ("UNHEALTHY", "#FF7E00"),
+        ("UNHEALTHY", "#FF0000"),
+        ("VERY UNHEALTHY", "#8F3F97"),
+        ("HAZARDOUS", "#7E0023")
+    )
+    UV_THRESHOLDS = (2, 5, 7, 10)
+    UV_STATES = (
+        ("LOW", "#00E400"),
+        ("MODERATE", "#FFFF00"),
+        ("HIGH", "#FF7E00"),
+        ("VERY HIGH", "#FF0000"),
+        ("EXTREME", "#8F3F97")
+    )
+    HUMIDITY_THRESHOLDS = (30, 50, 60, 70)
+    HUMIDITY_STATES = (
+        ("LOW", "#3EC1EC"),
+        ("NORMAL", "#00E400"),
+        ("SLIGHTLY HIGH", "#FFFF00"),
+        ("HIGH", "#FF7E00"),
+        ("VERY HIGH", "#FF0000")
+    )
+
     def __init__(self, root):
         self.root = root
         self.root.title("Weather Station Dashboard")
         
+        # Filled in by init_modbus/start_threads; shutdown may run before either does
+        self.sensor_thread = None
+        self.csv_thread = None
+        self.modbus_client = None
+        
         # Initialize system
         self.load_config()
         self.setup_logging()
@@ -42,17 +179,13 @@ class WeatherStationSystem:
         # Start system threads
         self.start_threads()
         
-        # Initial updates
-        self.update_display()
-        self.update_static_elements()
-        
         # Bind keys
         self.root.bind('<Escape>', lambda e: self.shutdown())
         self.root.bind('<F12>', self.toggle_mapping_mode)
         self.root.bind('<F5>', lambda e: self.force_update())  # Add F5 refresh
         
-        # Schedule periodic log rotation check
-        self.root.after(3600000, self.check_log_rotation)  # Check every hour
+        # Initial updates, then periodic display refresh and hourly log rotation check
+        self.start_scheduler()
         
     def load_config(self):
         """Load configuration from file or set defaults"""
@@ -157,24 +290,25 @@ class WeatherStationSystem:
             current_date = datetime.now().date()
             
             # List all log files
-            for filename in os.listdir(logs_dir):
-                if filename.startswith("weather_station_") and filename.endswith(".log"):
+            with os.scandir(logs_dir) as entries:
+                for entry in entries:
+                    match = LOG_FILE_PATTERN.fullmatch(entry.name)
+                    if not match:
+                        continue
                     try:
                         # Extract date from filename
-                        file_date_str = filename.replace("weather_station_", "").replace(".log", "")
-                        file_date = datetime.strptime(file_date_str, '%Y-%m-%d').date()
+                        file_date = datetime.strptime(match.group(1), '%Y-%m-%d').date()
                         
                         # Calculate age in days
                         age = (current_date - file_date).days
                         
                         # Remove if older than 7 days
                         if age > 7:
-                            file_path = os.path.join(logs_dir, filename)
-                            os.remove(file_path)
-                            print(f"Removed old log file: {filename}")
+                            os.remove(entry.path)
+                            print(f"Removed old log file: {entry.name}")
                     
                     except (ValueError, OSError) as e:
-                        print(f"Error processing log file {filename}: {e}")
+                        print(f"Error processing log file {entry.name}: {e}")
                         continue
 
         except Exception as e:
@@ -226,12 +360,19 @@ class WeatherStationSystem:
             'aqi': None,
             'timestamp': None
         }
-        self.data_queue = queue.Queue()
-        self.log_buffer = deque(maxlen=self.config['logging']['max_log_entries'])
+        self.data_queue = SpscRing(64)  # Sensor thread -> CSV writer; oldest rows are dropped when full
         self.last_rain_value = 0
         self.no_rain_counter = 0
         self.rain_reset_threshold = self.config['gui']['rain_reset_threshold']
         self.rain_reset_time = self.config['gui']['rain_reset_time']
+        self.load_sun_table()
+        self.data_dirty = True  # Set by the sensor thread whenever sensor_data is replaced
+        self.datetime_cache = None
+        self.datetime_cache_minute = None
+        
+        # itemconfig memo: canvas item -> last text / fill
+        self.last_text = {}
+        self.last_fill = {}
 
         # Create csv directory if it doesn't exist
         self.csv_dir = "csv_data"
@@ -243,21 +384,22 @@ class WeatherStationSystem:
         try:
             current_date = datetime.now().date()
             
-            for filename in os.listdir(self.csv_dir):
-                if filename.startswith("weather_data_") and filename.endswith(".csv"):
+            with os.scandir(self.csv_dir) as entries:
+                for entry in entries:
+                    match = CSV_FILE_PATTERN.fullmatch(entry.name)
+                    if not match:
+                        continue
                     try:
                         # Extract date from filename
-                        file_date_str = filename.replace("weather_data_", "").replace(".csv", "")
-                        file_date = datetime.strptime(file_date_str, '%Y-%m-%d').date()
+                        file_date = datetime.strptime(match.group(1), '%Y-%m-%d').date()
                         
                         # Remove if older than 7 days
                         if (current_date - file_date).days > 7:
-                            file_path = os.path.join(self.csv_dir, filename)
-                            os.remove(file_path)
-                            self.log(f"Removed old CSV file: {filename}")
+                            os.remove(entry.path)
+                            self.log(f"Removed old CSV file: {entry.name}")
                 
                     except (ValueError, OSError) as e:
-                        self.log(f"Error processing CSV file {filename}: {e}", level=logging.ERROR)
+                        self.log(f"Error processing CSV file {entry.name}: {e}", level=logging.ERROR)
 
         except Exception as e:
             self.log(f"Error cleaning up old CSV files: {e}", level=logging.ERROR)
@@ -313,6 +455,9 @@ class WeatherStationSystem:
         # Mapping mode variables
         self.mapping_mode = False
         self.coordinate_text = None
+        self.marker_oval = None
+        self.marker_text = None
+        self.marker_hide_timer = None
 
     def create_display_widgets(self):
         """Create all GUI display widgets"""
@@ -439,11 +584,17 @@ class WeatherStationSystem:
                 'widget': 'uv_value'
             },
             'aqi': {
-                'parser': lambda data: self.calculate_aqi(data.get('pm2_5')) if data.get('pm2_5') else None,
+                'parser': lambda data: self.calculate_aqi(data.get('pm2_5')) if data.get('pm2_5') is not None else None,
                 'display_format': lambda v: f"{v:.0f}",
                 'widget': 'aqi_value'
             }
         }
+        
+        # Resolve each sensor's parser, canvas item and formatter once for update_display
+        self.display_plan = [
+            (config['parser'], getattr(self, config['widget']), config['display_format'])
+            for config in self.sensor_configs.values()
+        ]
 
     def process_rainfall(self, current_rain):
         """Process rainfall data with reset logic"""
@@ -461,20 +612,11 @@ class WeatherStationSystem:
         self.last_rain_value = current_rain
         return current_rain
 
-    # def calculate_aqi(self, pm2_5):
-    #     """Calculate AQI from PM2.5 reading"""
-    #     if pm2_5 <= 12.0:
-    #         return (pm2_5 / 12.0) * 50
-    #     elif pm2_5 <= 35.4:
-    #         return ((pm2_5 - 12.1) / (35.4 - 12.1)) * (100 - 51) + 51
-    #     elif pm2_5 <= 55.4:
-    #         return ((pm2_5 - 35.5) / (55.4 - 35.5)) * (150 - 101) + 101
-    #     elif pm2_5 <= 150.4:
-    #         return ((pm2_5 - 55.5) / (150.4 - 55.5)) * (200 - 151) + 151
-    #     elif pm2_5 <= 250.4:
-    #         return ((pm2_5 - 150.5) / (250.4 - 150.5)) * (300 - 201) + 201
-    #     else:
-    #         return ((pm2_5 - 250.5) / (500.4 - 250.5)) * (500 - 301) + 301
+    def calculate_aqi(self, pm2_5):
+        """Calculate AQI from PM2.5 reading"""
+        if pm2_5 is None:
+            return None
+        return aqi_from_pm25(float(pm2_5))
 
     def start_threads(self):
         """Start background threads"""
@@ -489,6 +631,8 @@ class WeatherStationSystem:
         last_csv_time = time.time()
         
         while self.running:
+            # Schedule against a monotonic deadline so read latency doesn't drift the 1Hz cadence
+            deadline = time.monotonic() + 1.0
             try:
                 if not self.modbus_client.connect():
                     self.log("Modbus connection failed", level=logging.ERROR)
@@ -516,20 +660,21 @@ class WeatherStationSystem:
                     except Exception as e:
                         self.log(f"Error reading {sensor_name}: {e}", level=logging.ERROR)
                 
-                # Update shared data
+                # Update shared data and flag it for the next display refresh
                 self.sensor_data = current_data
+                self.data_dirty = True
                 
                 # Queue data for CSV writing if interval has passed
                 now = time.time()
                 if now - last_csv_time >= self.config['logging']['csv_interval']:
-                    self.data_queue.put(current_data)
+                    self.enqueue_csv_row(current_data)
                     last_csv_time = now
                 
-                time.sleep(1)  # Maintain 1Hz update rate
+                time.sleep(max(0.0, deadline - time.monotonic()))  # Maintain 1Hz update rate
                 
             except Exception as e:
                 self.log(f"Sensor read error: {e}", level=logging.ERROR)
-                time.sleep(1)
+                time.sleep(max(0.0, deadline - time.monotonic()))
 
     def log_sensor_data(self, sensor_name, data):
         """Log sensor data in appropriate format"""
@@ -558,10 +703,11 @@ class WeatherStationSystem:
             if result.isError():
                 return None
                 
+            temperature, humidity, pressure = scale_registers(result.registers, ENVIRONMENT_DIVISORS)
             return {
-                'temperature': result.registers[0] / 10.0,
-                'humidity': result.registers[1] / 10.0,
-                'pressure': result.registers[2] / 10.0
+                'temperature': temperature,
+                'humidity': humidity,
+                'pressure': pressure
             }
         except Exception as e:
             self.log(f"Environment sensor error: {e}", level=logging.ERROR)
@@ -579,7 +725,8 @@ class WeatherStationSystem:
             if result.isError():
                 return {'uv_index': 0.0}  # Return 0.0 instead of None
             
-            return {'uv_index': result.registers[0] / 100.0}
+            uv_index, = scale_registers(result.registers, UV_DIVISORS)
+            return {'uv_index': uv_index}
         except Exception as e:
             self.log(f"UV sensor error: {e}", level=logging.ERROR)
             return {'uv_index': 0.0}  # Return 0.0 instead of None
@@ -611,6 +758,9 @@ class WeatherStationSystem:
     def read_aqi_sensor(self):
         """Read AQI data from CSV file"""
         try:
+            # Imported here so pandas loads on the sensor thread, not before the first GUI paint;
+            # inside the try so a missing pandas is logged like any other AQI read failure
+            import pandas as pd
             # Get current timestamp
             current_time = datetime.now()
             
@@ -661,7 +811,8 @@ class WeatherStationSystem:
             if result.isError():
                 return {'wind_speed': 0.0}  # Return 0.0 instead of None
             
-            return {'wind_speed': result.registers[0] / 10.0}
+            wind_speed, = scale_registers(result.registers, WIND_SPEED_DIVISORS)
+            return {'wind_speed': wind_speed}
         except Exception as e:
             self.log(f"Wind speed sensor error: {e}", level=logging.ERROR)
             return {'wind_speed': 0.0}  # Return 0.0 instead of None
@@ -717,169 +868,220 @@ class WeatherStationSystem:
             if result.isError():
                 return None
                 
-            return {'rainfall': result.registers[0] / 10.0}
+            rainfall, = scale_registers(result.registers, RAINFALL_DIVISORS)
+            return {'rainfall': rainfall}
         except Exception as e:
             self.log(f"Rainfall sensor error: {e}", level=logging.ERROR)
             return None
 
+    def enqueue_csv_row(self, item):
+        """Hand a row to the CSV writer, dropping the oldest if the writer has fallen behind"""
+        if not self.data_queue.push(item):
+            self.log("CSV queue full, dropped oldest row", level=logging.WARNING)
+
+    def csv_row_values(self, data):
+        """Build the CSV row for one queued sensor snapshot"""
+        get = data.get
+        return [get(field, '') for field in self.CSV_FIELDS]
+
     def csv_writer_loop(self):
-        """Background thread for writing CSV data"""
-        while self.running:
-            try:
-                data = self.data_queue.get(timeout=1)
-                
-                # Get current date for filename
-                current_date = datetime.now().strftime('%Y-%m-%d')
-                csv_file = os.path.join(self.csv_dir, f"weather_data_{current_date}.csv")
-                
-                # Create new CSV file with headers if it doesn't exist
-                if not os.path.exists(csv_file):
-                    with open(csv_file, 'w') as f:
-                        writer = csv.writer(f)
-                        writer.writerow([
-                            'timestamp', 'temperature', 'humidity', 'pressure', 'uv_index',
-                            'co2', 'formaldehyde', 'tvoc', 'pm2_5', 'pm10',
-                            'aqi_temperature', 'aqi_humidity',
-                            'wind_speed', 'wind_dir_degrees', 'wind_dir_cardinal',
-                            'rainfall'
-                        ])
-                    # Clean up old CSV files when creating new one
-                    self.cleanup_old_csv()
-                
-                # Append data to current day's CSV
-                with open(csv_file, 'a') as f:
-                    writer = csv.writer(f)
-                    writer.writerow([
-                        data['timestamp'],
-                        data.get('temperature', ''),
-                        data.get('humidity', ''),
-                        data.get('pressure', ''),
-                        data.get('uv_index', ''),
-                        data.get('co2', ''),
-                        data.get('formaldehyde', ''),
-                        data.get('tvoc', ''),
-                        data.get('pm2_5', ''),
-                        data.get('pm10', ''),
-                        data.get('aqi_temperature', ''),
-                        data.get('aqi_humidity', ''),
-                        data.get('wind_speed', ''),
-                        data.get('wind_dir_degrees', ''),
-                        data.get('wind_dir_cardinal', ''),
-                        data.get('rainfall', '')
-                    ])
+        """Background thread for writing CSV data until the system stops running"""
+        csv_day = None
+        csv_handle = None
+        csv_interval = self.config['logging']['csv_interval']
+        try:
+            while True:
+                try:
+                    # Park until the sensor thread signals; the timeout only bounds shutdown latency
+                    self.data_queue.wait(timeout=csv_interval)
+                    batch = self.data_queue.drain()
+                    if not batch:
+                        if not self.running:
+                            break
+                        continue
                     
-            except queue.Empty:
-                continue
-            except Exception as e:
-                self.log(f"CSV write error: {e}", level=logging.ERROR)
+                    # Keep one buffered handle per day; only reopen when the day rolls over
+                    today = time.localtime()[:3]
+                    if today != csv_day or csv_handle is None:
+                        if csv_handle is not None:
+                            csv_handle.close()
+                            csv_handle = None
+                        current_date = time.strftime('%Y-%m-%d')
+                        csv_file = os.path.join(self.csv_dir, f"weather_data_{current_date}.csv")
+                        is_new = not os.path.exists(csv_file)
+                        csv_handle = open(csv_file, 'a', newline='', buffering=1 << 20)
+                        csv_day = today
+                        
+                        # New CSV file gets headers, and is a good moment to clean up old ones
+                        if is_new:
+                            csv_handle.write(format_csv_row(self.CSV_FIELDS))
+                            self.cleanup_old_csv()
+                    
+                    # Append the batch and flush once so the OS sees a single write
+                    csv_handle.write(''.join(format_csv_row(self.csv_row_values(row)) for row in batch))
+                    csv_handle.flush()
+                        
+                except Exception as e:
+                    self.log(f"CSV write error: {e}", level=logging.ERROR)
+                    # Drop the handle so the next batch reopens the file from scratch
+                    if csv_handle is not None:
+                        try:
+                            csv_handle.close()
+                        except OSError:
+                            pass
+                        csv_handle = None
+                
+                if not self.running:
+                    break
+        finally:
+            if csv_handle is not None:
+                csv_handle.close()
 
     def get_datetime_info(self):
-        """Get current date and time information"""
-        now = datetime.now()
-        return {
-            'day': now.strftime('%A').upper(),  # Convert weekday to uppercase
-            'date': now.strftime('%d %b').replace(now.strftime('%b'), now.strftime('%b').upper()) + now.strftime(' %Y'),
-            'time': now.strftime('%H:%M')
+        """Get current date and time information, cached for the current minute"""
+        minute = int(time.time() // 60)
+        if minute == self.datetime_cache_minute:
+            return self.datetime_cache
+        
+        lt = time.localtime(minute * 60)
+        self.datetime_cache = {
+            'day': DAY_NAMES[lt.tm_wday],
+            'date': f"{lt.tm_mday:02d} {MONTH_NAMES[lt.tm_mon - 1]} {lt.tm_year}",
+            'time': f"{lt.tm_hour:02d}:{lt.tm_min:02d}"
         }
+        self.datetime_cache_minute = minute
+        return self.datetime_cache
 
     def get_aqi_state(self, aqi):
         """Determine AQI state and color"""
         if aqi is None:
             return "N/A", "#FFFFFF"
-        elif 0 <= aqi <= 50:
-            return "GOOD", "#00E400"
-        elif 51 <= aqi <= 100:
-            return "MODERATE", "#FFFF00"
-        elif 101 <= aqi <= 150:
-            return "UNHEALTHY", "#FF7E00"
-        elif 151 <= aqi <= 200:
-            return "UNHEALTHY", "#FF0000"
-        elif 201 <= aqi <= 300:
-            return "VERY UNHEALTHY", "#8F3F97"
-        else:
-            return "HAZARDOUS", "#7E0023"
+        return self.AQI_STATES[bisect.bisect_left(self.AQI_THRESHOLDS, aqi)]
 
     def get_uv_state(self, uv):
         """Determine UV state and color"""
         if uv is None:
             return "N/A", "#FFFFFF"
-        elif 0 <= uv <= 2:
-            return "LOW", "#00E400"
-        elif 3 <= uv <= 5:
-            return "MODERATE", "#FFFF00"
-        elif 6 <= uv <= 7:
-            return "HIGH", "#FF7E00"
-        elif 8 <= uv <= 10:
-            return "VERY HIGH", "#FF0000"
-        else:
-            return "EXTREME", "#8F3F97"
+        return self.UV_STATES[bisect.bisect_left(self.UV_THRESHOLDS, uv)]
 
     def get_humidity_state(self, humidity):
         """Determine humidity state and color"""
         if humidity is None:
             return "N/A", "#FFFFFF"
-        elif 0 <= humidity <= 30:
-            return "LOW", "#3EC1EC"
-        elif 31 <= humidity <= 50:
-            return "NORMAL", "#00E400"
-        elif 51 <= humidity <= 60:
-            return "SLIGHTLY HIGH", "#FFFF00"
-        elif 61 <= humidity <= 70:
-            return "HIGH", "#FF7E00"
-        else:
-            return "VERY HIGH", "#FF0000"
+        return self.HUMIDITY_STATES[bisect.bisect_left(self.HUMIDITY_THRESHOLDS, humidity)]
 
     def update_static_elements(self):
         """Update date, time and sun information"""
         datetime_info = self.get_datetime_info()
         sun_info = self.get_sun_info()
 
-        self.bg_canvas.itemconfig(self.current_day_value, text=datetime_info['day'])
-        self.bg_canvas.itemconfig(self.current_date_value, text=datetime_info['date'])
-        self.bg_canvas.itemconfig(self.current_time_value, text=datetime_info['time'])
+        self._set_text(self.current_day_value, datetime_info['day'])
+        self._set_text(self.current_date_value, datetime_info['date'])
+        self._set_text(self.current_time_value, datetime_info['time'])
         
-        self.bg_canvas.itemconfig(self.sunrise_value, text=f"↑{sun_info['sunrise']}")
-        self.bg_canvas.itemconfig(self.sunset_value, text=f"↓{sun_info['sunset']}")
-
-        self.root.after(60000, self.update_static_elements)
+        self._set_text(self.sunrise_value, f"↑{sun_info['sunrise']}")
+        self._set_text(self.sunset_value, f"↓{sun_info['sunset']}")
 
     def update_display(self):
         """Update all display elements with current sensor data"""
+        # Nothing new from the sensor thread since the last refresh
+        if not self.data_dirty:
+            return
+        self.data_dirty = False
+        
         try:
-            # Update sensor values
-            for sensor_name, config in self.sensor_configs.items():
-                value = config['parser'](self.sensor_data)
+            # Update sensor values (locals hoisted out of the per-widget loop)
+            data = self.sensor_data
+            set_text = self._set_text
+            for parser, widget, display_format in self.display_plan:
+                value = parser(data)
                 if value is not None:
-                    widget = getattr(self, config['widget'])
-                    formatted_value = config['display_format'](value)
-                    self.bg_canvas.itemconfig(widget, text=formatted_value)
+                    set_text(widget, display_format(value))
             
             # Update states with colors
             self.update_state_displays()
             
         except Exception as e:
             self.log(f"Display update error: {e}", level=logging.ERROR)
+
+    def start_scheduler(self):
+        """Register the periodic tasks and start the single Tk timer that drives them"""
+        now = time.monotonic()
+        # [callback, interval in seconds, next deadline]
+        self.scheduled_tasks = [
+            [self.update_display, self.config['gui']['update_interval'] / 1000.0, now],
+            [self.update_static_elements, 60.0, now],
+            [self.check_log_rotation, 3600.0, now + 3600.0]
+        ]
+        self._tick()
+
+    def _tick(self):
+        """Run every task whose deadline has passed, then sleep until the earliest next one"""
+        now = time.monotonic()
+        for task in self.scheduled_tasks:
+            callback, interval, deadline = task
+            if now < deadline:
+                continue
+            try:
+                callback()
+            except Exception as e:
+                self.log(f"Scheduled task {callback.__name__} failed: {e}", level=logging.ERROR)
+            # Stay on the task's own grid unless we've fallen a whole interval behind
+            task[2] = deadline + interval if deadline + interval > now else now + interval
         
-        # Schedule next update
-        self.root.after(self.config['gui']['update_interval'], self.update_display)
+        next_deadline = min(task[2] for task in self.scheduled_tasks)
+        delay_ms = max(1, int((next_deadline - time.monotonic()) * 1000))
+        # Hop through after_idle so a late tick waits for pending input/redraws instead of
+        # competing with them; only one tick is ever queued since we reschedule from here
+        self.root.after(delay_ms, self.root.after_idle, self._tick)
 
     def update_state_displays(self):
         """Update state displays with appropriate colors"""
+        data = self.sensor_data
+        set_fill = self._set_fill
+        set_text_fill = self._set_text_fill
+        
         # Humidity state
-        hum_state, hum_color = self.get_humidity_state(self.sensor_data.get('humidity'))
-        self.bg_canvas.itemconfig(self.humidity_value, fill=hum_color)
-        self.bg_canvas.itemconfig(self.humidity_state_value, text=hum_state, fill=hum_color)
+        hum_state, hum_color = self.get_humidity_state(data.get('humidity'))
+        set_fill(self.humidity_value, hum_color)
+        set_text_fill(self.humidity_state_value, hum_state, hum_color)
         
         # AQI state
-        aqi = self.calculate_aqi(self.sensor_data.get('pm2_5')) if self.sensor_data.get('pm2_5') else None
+        pm2_5 = data.get('pm2_5')
+        aqi = self.calculate_aqi(pm2_5) if pm2_5 is not None else None
         aqi_state, aqi_color = self.get_aqi_state(aqi)
-        self.bg_canvas.itemconfig(self.aqi_value, fill=aqi_color)
-        self.bg_canvas.itemconfig(self.aqi_state_value, text=aqi_state, fill=aqi_color)
+        set_fill(self.aqi_value, aqi_color)
+        set_text_fill(self.aqi_state_value, aqi_state, aqi_color)
         
         # UV state
-        uv_state, uv_color = self.get_uv_state(self.sensor_data.get('uv_index'))
-        self.bg_canvas.itemconfig(self.uv_value, fill=uv_color)
-        self.bg_canvas.itemconfig(self.uv_state_value, text=uv_state, fill=uv_color)
+        uv_state, uv_color = self.get_uv_state(data.get('uv_index'))
+        set_fill(self.uv_value, uv_color)
+        set_text_fill(self.uv_state_value, uv_state, uv_color)
+
+    def _set_text(self, item, text):
+        """Update text if changed"""
+        if self.last_text.get(item) != text:
+            self.bg_canvas.itemconfig(item, text=text)
+            self.last_text[item] = text
+
+    def _set_fill(self, item, fill):
+        """Update fill if changed"""
+        if self.last_fill.get(item) != fill:
+            self.bg_canvas.itemconfig(item, fill=fill)
+            self.last_fill[item] = fill
+
+    def _set_text_fill(self, item, text, fill):
+        """Update text and fill in one call if either changed"""
+        last_text, last_fill = self.last_text, self.last_fill
+        options = {}
+        if last_text.get(item) != text:
+            options['text'] = text
+            last_text[item] = text
+        if last_fill.get(item) != fill:
+            options['fill'] = fill
+            last_fill[item] = fill
+        if options:
+            self.bg_canvas.itemconfig(item, **options)
 
     def toggle_mapping_mode(self, event=None):
         """Toggle coordinate mapping mode"""
@@ -894,84 +1096,101 @@ class WeatherStationSystem:
                 fill='red',
                 anchor='nw'
             )
+            # Click marker is created once and moved around, hidden until the first click
+            if self.marker_oval is None:
+                self.marker_oval = self.bg_canvas.create_oval(0, 0, 0, 0, fill='red', state='hidden')
+                self.marker_text = self.bg_canvas.create_text(
+                    0, 0,
+                    text="",
+                    fill='red',
+                    anchor='w',
+                    state='hidden'
+                )
         else:
             self.bg_canvas.unbind('<Button-1>')
             if self.coordinate_text:
                 self.bg_canvas.delete(self.coordinate_text)
+            self.hide_coordinate_marker()
 
     def show_coordinates(self, event):
         """Display coordinates where user clicked"""
         x, y = event.x, event.y
         print(f"Coordinates: x={x}, y={y}")
         
-        marker = self.bg_canvas.create_oval(
-            x-2, y-2, x+2, y+2, 
-            fill='red'
-        )
-        text = self.bg_canvas.create_text(
-            x+10, y-10,
-            text=f"({x}, {y})",
-            fill='red',
-            anchor='w'
-        )
+        self.bg_canvas.coords(self.marker_oval, x-2, y-2, x+2, y+2)
+        self.bg_canvas.coords(self.marker_text, x+10, y-10)
+        self.bg_canvas.itemconfig(self.marker_oval, state='normal')
+        self.bg_canvas.itemconfig(self.marker_text, text=f"({x}, {y})", state='normal')
         
-        self.root.after(2000, lambda: self.bg_canvas.delete(marker, text))
+        # Restart the hide timer so rapid clicks don't stack callbacks
+        if self.marker_hide_timer:
+            self.root.after_cancel(self.marker_hide_timer)
+        self.marker_hide_timer = self.root.after(2000, self.hide_coordinate_marker)
+
+    def hide_coordinate_marker(self):
+        """Hide the mapping mode click marker"""
+        if self.marker_hide_timer:
+            self.root.after_cancel(self.marker_hide_timer)
+            self.marker_hide_timer = None
+        if self.marker_oval is not None:
+            self.bg_canvas.itemconfig(self.marker_oval, state='hidden')
+            self.bg_canvas.itemconfig(self.marker_text, state='hidden')
 
     def shutdown(self):
         """Clean shutdown of the system"""
         self.log("Shutting down weather station system")
         self.running = False
+        self.data_queue.wake()  # Let the CSV writer flush what's left and exit
         
-        if hasattr(self, 'sensor_thread'):
+        if self.sensor_thread is not None:
             self.sensor_thread.join(timeout=2)
-        if hasattr(self, 'csv_thread'):
+        if self.csv_thread is not None:
             self.csv_thread.join(timeout=2)
         
-        if hasattr(self, 'modbus_client') and self.modbus_client.connected:
+        if self.modbus_client is not None and self.modbus_client.connected:
             self.modbus_client.close()
         
         self.root.quit()
 
-    def get_sun_info(self):
-        """Get sunrise and sunset times for Karachi"""
+    def load_sun_table(self):
+        """Load sunrise/sunset times for every MM-DD from the sun data CSV once"""
+        self.sun_table = {}
+        sun_data_file = os.path.join('awos_assit_code', 'karachi_sun_data.csv')
+        
+        if not os.path.exists(sun_data_file):
+            self.log(f"Sun data file not found: {sun_data_file}", level=logging.WARNING)
+            return
+        
         try:
-            # Get current date in MM-DD format
-            current_date = datetime.now().strftime('%m-%d')
-            
-            # Read sun data from CSV file
-            sun_data_file = os.path.join('awos_assit_code', 'karachi_sun_data.csv')
-            
-            if not os.path.exists(sun_data_file):
-                self.log(f"Sun data file not found: {sun_data_file}", level=logging.WARNING)
-                return {
-                    'sunrise': '06:00',
-                    'sunset': '18:00'
-                }
-            
             with open(sun_data_file, 'r') as file:
-                csv_reader = csv.DictReader(file)
-                for row in csv_reader:
-                    if row['date'] == current_date:
-                        return {
-                            'sunrise': row['sunrise'],
-                            'sunset': row['sunset']
-                        }
-            
-            self.log(f"No sun data found for date: {current_date}", level=logging.WARNING)
-            return {
-                'sunrise': '06:00',
-                'sunset': '18:00'
-            }
-            
+                for row in csv.DictReader(file):
+                    self.sun_table[row['date']] = (row['sunrise'], row['sunset'])
         except Exception as e:
             self.log(f"Error reading sun data: {e}", level=logging.ERROR)
+
+    def get_sun_info(self):
+        """Get sunrise and sunset times for Karachi"""
+        # Get current date in MM-DD format
+        current_date = datetime.now().strftime('%m-%d')
+        sun_times = self.sun_table.get(current_date)
+        
+        if sun_times is None:
+            self.log(f"No sun data found for date: {current_date}", level=logging.WARNING)
             return {
                 'sunrise': '06:00',
                 'sunset': '18:00'
             }
+        
+        return {
+            'sunrise': sun_times[0],
+            'sunset': sun_times[1]
+        }
 
     def force_update(self):
         """Force immediate update of all display elements"""
+        self.last_text.clear()
+        self.last_fill.clear()
+        self.data_dirty = True
         self.update_display()
         self.update_static_elements()
         self.log("Display manually refreshed", level=logging.INFO)
@@ -979,8 +1198,6 @@ class WeatherStationSystem:
     def check_log_rotation(self):
         """Periodic check for log rotation"""
         self.check_and_rotate_logs()
-        # Schedule next check
-        self.root.after(3600000, self.check_log_rotation)  # Check every hour
 
 if __name__ == "__main__":
     try:
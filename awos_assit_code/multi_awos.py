@@ -1,23 +1,26 @@
 #!/usr/bin/env python3
+import bisect
 import csv
+import glob
 import tkinter as tk
 from tkinter import ttk
 import warnings
 from PIL import Image, ImageTk
 from pymodbus.client import ModbusSerialClient
+from pymodbus.exceptions import ConnectionException
 import time
-from datetime import datetime
+from datetime import datetime, timedelta
 import logging
 import os
-import queue
 import threading
 from collections import deque
+from types import MappingProxyType
 import configparser
 import math
 import json
-from logging.handlers import RotatingFileHandler
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+import queue
 import sys
-import pandas as pd
 
 # Disable DecompressionBombWarning
 Image.MAX_IMAGE_PIXELS = None
@@ -26,10 +29,158 @@ warnings.filterwarnings("ignore", category=Image.DecompressionBombWarning)
 # Add path for awos_assit_code
 sys.path.append(os.path.join(os.path.dirname(__file__), 'awos_assit_code'))
 
+# Redraws are flushed with update_idletasks() at most once per refresh; a full
+# update() runs a nested event loop and can re-enter our own callbacks
+if os.environ.get('WSS_DEBUG'):
+    def _forbid_update(self):
+        raise RuntimeError("use update_idletasks() instead of update()")
+    tk.Misc.update = _forbid_update
+
+# sensor_data key -> column in the AQI CSV, in the order they are reported
+AQI_CSV_COLUMNS = (
+    ('co2', 'carbon_dioxide'),
+    ('pm2_5', 'pm2_5'),
+    ('pm10', 'pm10'),
+    ('carbon_monoxide', 'carbon_monoxide'),
+    ('nitrogen_dioxide', 'nitrogen_dioxide'),
+    ('sulphur_dioxide', 'sulphur_dioxide'),
+    ('ozone', 'ozone')
+)
+
+# AQI breakpoints for PM2.5 (ug/m3), upper bound per segment
+PM25_BP_HI = (12.0, 35.4, 55.4, 150.4, 250.4, 500.4)
+# (concentration low, AQI low, AQI high) per segment
+PM25_SEGMENTS = (
+    (0.0, 0, 50),
+    (12.1, 51, 100),
+    (35.5, 101, 150),
+    (55.5, 151, 200),
+    (150.5, 201, 300),
+    (250.5, 301, 500)
+)
+PM25_LAST_SEGMENT = len(PM25_BP_HI) - 1
+# (concentration low, AQI low, slope) per segment
+PM25_LINEAR = tuple(
+    (bp_lo, aqi_lo, (aqi_hi - aqi_lo) / (bp_hi - bp_lo))
+    for (bp_lo, aqi_lo, aqi_hi), bp_hi in zip(PM25_SEGMENTS, PM25_BP_HI)
+)
+
+def aqi_from_pm25(pm2_5):
+    """AQI for a PM2.5 concentration"""
+    i = bisect.bisect_left(PM25_BP_HI, pm2_5)
+    if i > PM25_LAST_SEGMENT:
+        i = PM25_LAST_SEGMENT  # Extrapolate the top segment past 500.4
+    bp_lo, aqi_lo, slope = PM25_LINEAR[i]
+    return (pm2_5 - bp_lo) * slope + aqi_lo
+
+# Column order of the daily weather CSV (also the sensor_data keys written to it)
+CSV_COLUMNS = (
+    'timestamp', 'temperature', 'humidity', 'pressure', 'uv_index',
+    'co2', 'formaldehyde', 'tvoc', 'pm2_5', 'pm10',
+    'aqi_temperature', 'aqi_humidity',
+    'wind_speed', 'wind_dir_degrees', 'wind_dir_cardinal',
+    'rainfall'
+)
+
+# 16-point compass, 22.5 degrees per sector starting at north
+CARDINAL_DIRECTIONS = (
+    "N", "NNE", "NE", "ENE", "E", "ESE", "SE", "SSE",
+    "S", "SSW", "SW", "WSW", "W", "WNW", "NW", "NNW"
+)
+
+# State bands: inclusive upper bounds, then (label, colour) per band
+AQI_STATE_HI = (50.0, 100.0, 150.0, 200.0, 300.0)
+AQI_STATES = (
+    ("GOOD", "#39FF14"),
+    ("MODERATE", "#FFFF00"),
+    ("UNHEALTHY", "#FF7E00"),
+    ("UNHEALTHY", "#FF0000"),
+    ("VERY UNHEALTHY", "#8F3F97"),
+    ("HAZARDOUS", "#7E0023")
+)
+UV_STATE_HI = (2.0, 5.0, 7.0, 10.0)
+UV_STATES = (
+    ("LOW", "#39FF14"),
+    ("MODERATE", "#FFFF00"),
+    ("HIGH", "#FF7E00"),
+    ("VERY HIGH", "#FF0000"),
+    ("EXTREME", "#8F3F97")
+)
+HUMIDITY_STATE_HI = (30.0, 50.0, 60.0, 70.0)
+HUMIDITY_STATES = (
+    ("LOW", "#3EC1EC"),
+    ("NORMAL", "#39FF14"),
+    ("SLIGHTLY HIGH", "#FFFF00"),
+    ("HIGH", "#FF7E00"),
+    ("VERY HIGH", "#FF0000")
+)
+NO_STATE = ("N/A", "#FFFFFF")
+
+def aqi_state(aqi):
+    """(label, colour) for an AQI value"""
+    if aqi is None or math.isnan(aqi):
+        return NO_STATE  # Missing reading (load_aqi_table uses NaN for empty cells)
+    return AQI_STATES[bisect.bisect_left(AQI_STATE_HI, float(aqi))]
+
+def uv_state(uv):
+    """(label, colour) for a UV index"""
+    if uv is None or math.isnan(uv):
+        return NO_STATE
+    return UV_STATES[bisect.bisect_left(UV_STATE_HI, float(uv))]
+
+def humidity_state(humidity):
+    """(label, colour) for a relative humidity"""
+    if humidity is None or math.isnan(humidity):
+        return NO_STATE
+    return HUMIDITY_STATES[bisect.bisect_left(HUMIDITY_STATE_HI, float(humidity))]
+
+def sun_entry(sunrise, sunset):
+    """get_sun_info result for 'HH:MM' sunrise/sunset strings, with the parsed times alongside"""
+    return {
+        'sunrise': sunrise,
+        'sunset': sunset,
+        'sunrise_time': datetime.strptime(sunrise, '%H:%M').time(),
+        'sunset_time': datetime.strptime(sunset, '%H:%M').time()
+    }
+
+# Used when the sun data file or today's row is missing
+DEFAULT_SUN_INFO = sun_entry('06:00', '18:00')
+
+def wall_clock_seconds(dt):
+    """Seconds since 1970-01-01 for a naive datetime, taken as wall-clock time (no tz shift)"""
+    return (dt.toordinal() - 719163) * 86400 + dt.hour * 3600 + dt.minute * 60 + dt.second
+
+class DailyLogHandler(RotatingFileHandler):
+    """Size-capped handler that moves to the next day's log file at midnight"""
+
+    def __init__(self, logs_dir, max_bytes, backup_count):
+        self.logs_dir = logs_dir
+        self.day_end = 0.0  # Timestamp of the midnight that ends the current file's day
+        super().__init__(self.path_for(time.time()), maxBytes=max_bytes,
+                         backupCount=backup_count, delay=True)
+        self.setFormatter(logging.Formatter('%(asctime)s - %(levelname)s - %(message)s'))
+
+    def path_for(self, timestamp):
+        """Log file for the day containing timestamp; also moves day_end to that day's end"""
+        day = datetime.fromtimestamp(timestamp).date()
+        self.day_end = datetime.combine(day + timedelta(days=1), datetime.min.time()).timestamp()
+        return os.path.abspath(os.path.join(self.logs_dir, f"weather_station_{day.isoformat()}.log"))
+
+    def emit(self, record):
+        """Write the record, switching files first if it belongs to a new day"""
+        if record.created >= self.day_end:
+            if self.stream:
+                self.stream.close()
+                self.stream = None  # Reopened lazily under the new name
+            self.baseFilename = self.path_for(record.created)
+        super().emit(record)
+
 class DataManager:
     """Manages sensor data collection and distribution"""
     def __init__(self, config):
         self.config = config
+        # Latest readings. Published by the sensor thread as a brand-new dict each pass and
+        # never mutated afterwards, so readers just grab one reference and use it lock-free
         self.sensor_data = {
             'temperature': None,
             'humidity': None,
@@ -41,16 +192,32 @@ class DataManager:
             'aqi': None,
             'timestamp': None
         }
-        self.data_queue = queue.Queue()
+        # Sensor thread -> CSV writer handoff; append/popleft are atomic, the event avoids polling
+        self.data_queue = deque(maxlen=4096)
+        self.data_ready = threading.Event()
+        # Parsed AQI CSV, reloaded only when the file's mtime changes
+        self.aqi_cache = {'mtime': None, 'ts': None, 'rows': None}
+        # MM-DD -> sun_entry() from the sun data CSV, reloaded on mtime change
+        self.sun_cache = {'mtime': None, 'table': {}}
         self.last_rain_value = 0
         self.no_rain_counter = 0
         self.rain_reset_threshold = config['gui']['rain_reset_threshold']
         self.rain_reset_time = config['gui']['rain_reset_time']
+        self.csv_interval = config['logging']['csv_interval']
         self.running = False
         self.modbus_client = None
         self.logger = None
+        self.log_listener = None
         self.sensors_connected = False  # Flag to track sensor connection status
+        self.modbus_needs_reconnect = False  # Set by _read_registers when the serial link drops
         self.csv_dir = "csv_data"
+        # Dates the old-file cleanups last ran, so they happen at most once a day
+        self.last_log_cleanup = None
+        self.last_csv_cleanup = None
+        # Open handle/writer for the current day's CSV, owned by the CSV writer thread
+        self.csv_date = None  # Day whose file (and header) csv_fh currently covers
+        self.csv_fh = None
+        self.csv_writer = None
         if not os.path.exists(self.csv_dir):
             os.makedirs(self.csv_dir)
         self.setup_logging()
@@ -62,44 +229,55 @@ class DataManager:
             logs_dir = "logs"
             if not os.path.exists(logs_dir):
                 os.makedirs(logs_dir)
-            current_date = datetime.now().strftime('%Y-%m-%d')
-            log_file = os.path.join(logs_dir, f"weather_station_{current_date}.log")
-            file_handler = logging.FileHandler(log_file)
-            file_handler.setFormatter(
-                logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
-            )
-            self.logger = logging.getLogger('WeatherStation')
-            self.logger.setLevel(logging.INFO)
-            self.logger.addHandler(file_handler)
+            handlers = [DailyLogHandler(
+                logs_dir,
+                self.config['logging']['log_rotate_size'],
+                self.config['logging']['log_backup_count']
+            )]
             if self.config['logging'].get('debug', False):
                 console_handler = logging.StreamHandler()
                 console_handler.setLevel(logging.DEBUG)
-                self.logger.addHandler(console_handler)
+                handlers.append(console_handler)
+            # Callers (including the Tk thread) only enqueue records; the listener
+            # thread formats them and does all of the file I/O
+            self.log_queue = queue.SimpleQueue()
+            self.log_listener = QueueListener(self.log_queue, *handlers, respect_handler_level=True)
+            self.log_listener.start()
+            self.logger = logging.getLogger('WeatherStation')
+            self.logger.setLevel(logging.INFO)
+            self.logger.propagate = False  # Our handlers are the only consumers; skip the root logger
+            self.logger.addHandler(QueueHandler(self.log_queue))
             self.cleanup_old_logs(logs_dir)
             self.log("Data Manager Initialized")
         except Exception as e:
             print(f"Error setting up logging: {e}")
             raise
 
+    def check_and_rotate_logs(self):
+        """Daily log housekeeping; DailyLogHandler switches files on its own at midnight"""
+        self.cleanup_old_logs("logs")
+
     def cleanup_old_logs(self, logs_dir):
-        """Remove log files older than 7 days"""
+        """Remove log files (and their rotated backups) older than 7 days, at most once a day"""
+        today = datetime.now().date()
+        if self.last_log_cleanup == today:
+            return
+        self.last_log_cleanup = today
         try:
-            current_date = datetime.now().date()
-            for filename in os.listdir(logs_dir):
-                if filename.startswith("weather_station_") and filename.endswith(".log"):
-                    file_date_str = filename.replace("weather_station_", "").replace(".log", "")
-                    file_date = datetime.strptime(file_date_str, '%Y-%m-%d').date()
-                    if (current_date - file_date).days > 7:
-                        file_path = os.path.join(logs_dir, filename)
-                        os.remove(file_path)
-                        self.log(f"Removed old log file: {filename}")
+            # ISO dates compare correctly as strings, so no per-file date parsing is needed
+            cutoff = (today - timedelta(days=7)).isoformat()
+            for path in glob.glob(os.path.join(logs_dir, "weather_station_????-??-??.log*")):
+                filename = os.path.basename(path)
+                if filename[16:26] < cutoff:
+                    os.remove(path)
+                    self.log(f"Removed old log file: {filename}")
         except Exception as e:
             self.log(f"Error cleaning up old logs: {e}", level=logging.ERROR)
 
-    def log(self, message, level=logging.INFO):
-        """Log message with timestamp"""
+    def log(self, message, *args, level=logging.INFO):
+        """Log message with timestamp (%-style args are only formatted if the record is emitted)"""
         if self.logger:
-            self.logger.log(level, message)
+            self.logger.log(level, message, *args)
 
     def init_modbus(self):
         """Initialize Modbus client connection"""
@@ -122,17 +300,18 @@ class DataManager:
             self.log(f"Modbus initialization error: {e}, using placeholder data", level=logging.ERROR)
 
     def cleanup_old_csv(self):
-        """Remove CSV files older than 7 days"""
+        """Remove CSV files older than 7 days, at most once a day"""
+        today = datetime.now().date()
+        if self.last_csv_cleanup == today:
+            return
+        self.last_csv_cleanup = today
         try:
-            current_date = datetime.now().date()
-            for filename in os.listdir(self.csv_dir):
-                if filename.startswith("weather_data_") and filename.endswith(".csv"):
-                    file_date_str = filename.replace("weather_data_", "").replace(".csv", "")
-                    file_date = datetime.strptime(file_date_str, '%Y-%m-%d').date()
-                    if (current_date - file_date).days > 7:
-                        file_path = os.path.join(self.csv_dir, filename)
-                        os.remove(file_path)
-                        self.log(f"Removed old CSV file: {filename}")
+            cutoff = (today - timedelta(days=7)).isoformat()
+            for path in glob.glob(os.path.join(self.csv_dir, "weather_data_????-??-??.csv")):
+                filename = os.path.basename(path)
+                if filename[13:23] < cutoff:
+                    os.remove(path)
+                    self.log(f"Removed old CSV file: {filename}")
         except Exception as e:
             self.log(f"Error cleaning up old CSV files: {e}", level=logging.ERROR)
 
@@ -152,50 +331,51 @@ class DataManager:
 
     def calculate_aqi(self, pm2_5):
         """Calculate AQI from PM2.5 reading"""
-        if pm2_5 is None:
+        if pm2_5 is None or math.isnan(pm2_5):
             return None
-        if pm2_5 <= 12.0:
-            return (pm2_5 / 12.0) * 50
-        elif pm2_5 <= 35.4:
-            return ((pm2_5 - 12.1) / (35.4 - 12.1)) * (100 - 51) + 51
-        elif pm2_5 <= 55.4:
-            return ((pm2_5 - 35.5) / (55.4 - 35.5)) * (150 - 101) + 101
-        elif pm2_5 <= 150.4:
-            return ((pm2_5 - 55.5) / (150.4 - 55.5)) * (200 - 151) + 151
-        elif pm2_5 <= 250.4:
-            return ((pm2_5 - 150.5) / (250.4 - 150.5)) * (300 - 201) + 201
-        else:
-            return ((pm2_5 - 250.5) / (500.4 - 250.5)) * (500 - 301) + 301
+        return aqi_from_pm25(pm2_5)
+
+    def calculate_aqi_vector(self, pm2_5_values):
+        """Calculate AQI for a whole array/column of PM2.5 readings (e.g. CSV post-processing)"""
+        import numpy as np  # Only needed for batch use, not by the running station
+        pm = np.asarray(pm2_5_values, dtype=float)
+        i = np.minimum(np.searchsorted(PM25_BP_HI, pm, side='left'), PM25_LAST_SEGMENT)
+        segments = np.asarray(PM25_LINEAR, dtype=float)
+        bp_lo, aqi_lo, slope = segments[i, 0], segments[i, 1], segments[i, 2]
+        return (pm - bp_lo) * slope + aqi_lo
 
     def sensor_reader_loop(self):
         """Main loop for reading sensor data"""
         last_csv_time = time.time()
         while self.running:
+            # Pace against a monotonic deadline so the serial round-trips happen inside
+            # the 1 s period instead of being added on top of it
+            deadline = time.monotonic() + 1.0
             try:
                 current_data = {'timestamp': datetime.now().isoformat()}
+                # Only touch the port again after a read actually failed on the connection
+                if self.sensors_connected and self.modbus_needs_reconnect:
+                    self.modbus_needs_reconnect = False
+                    if not self.modbus_client.connect():
+                        self.sensors_connected = False
+                        self.log("Modbus connection lost, switching to placeholder data", level=logging.WARNING)
                 if self.sensors_connected:
-                    if not self.modbus_client.is_socket_open():
-                        self.modbus_client.connect()
-                        if not self.modbus_client.is_socket_open():
-                            self.sensors_connected = False
-                            self.log("Modbus connection lost, switching to placeholder data", level=logging.WARNING)
-                    else:
-                        sensors = [
-                            ('environment', self.read_environment_sensor),
-                            ('uv', self.read_uv_sensor),
-                            ('aqi', self.read_aqi_sensor),
-                            ('wind_speed', self.read_wind_speed),
-                            ('wind_direction', self.read_wind_direction),
-                            ('rainfall', self.read_rainfall)
-                        ]
-                        for sensor_name, reader in sensors:
-                            try:
-                                data = reader()
-                                if data:
-                                    current_data.update(data)
-                                    self.log_sensor_data(sensor_name, data)
-                            except Exception as e:
-                                self.log(f"Error reading {sensor_name}: {e}", level=logging.ERROR)
+                    sensors = [
+                        ('environment', self.read_environment_sensor),
+                        ('uv', self.read_uv_sensor),
+                        ('aqi', self.read_aqi_sensor),
+                        ('wind_speed', self.read_wind_speed),
+                        ('wind_direction', self.read_wind_direction),
+                        ('rainfall', self.read_rainfall)
+                    ]
+                    for sensor_name, reader in sensors:
+                        try:
+                            data = reader()
+                            if data:
+                                current_data.update(data)
+                                self.log_sensor_data(sensor_name, data)
+                        except Exception as e:
+                            self.log(f"Error reading {sensor_name}: {e}", level=logging.ERROR)
                 else:
                     # Use placeholder data when sensors are not connected
                     current_data.update({
@@ -216,82 +396,101 @@ class DataManager:
                     except Exception as e:
                         self.log(f"Error reading AQI data: {e}", level=logging.WARNING)
 
-                self.sensor_data = current_data
+                self.sensor_data = current_data  # Atomic publish; current_data is not touched again
                 now = time.time()
-                if now - last_csv_time >= self.config['logging']['csv_interval']:
-                    self.data_queue.put(current_data)
+                if now - last_csv_time >= self.csv_interval:
+                    self.data_queue.append(current_data)
+                    self.data_ready.set()
                     last_csv_time = now
-                time.sleep(1)
+                time.sleep(max(0.0, deadline - time.monotonic()))
             except Exception as e:
                 self.log(f"Sensor read error: {e}", level=logging.ERROR)
-                time.sleep(1)
+                time.sleep(max(0.0, deadline - time.monotonic()))
 
     def csv_writer_loop(self):
         """Background thread for writing CSV data"""
-        while self.running:
+        try:
+            while self.running:
+                try:
+                    # Sleep until the sensor thread signals (or stop() wakes us), then take
+                    # everything queued as one batch
+                    self.data_ready.wait()
+                    self.data_ready.clear()
+                    batch = []
+                    while self.data_queue:
+                        batch.append(self.data_queue.popleft())
+                    if not batch:
+                        continue
+                    # Only look at the filesystem when the day changes (or after a reopen)
+                    current_date = datetime.now().strftime('%Y-%m-%d')
+                    if current_date != self.csv_date or self.csv_fh is None:
+                        self.close_csv()
+                        csv_file = os.path.join(self.csv_dir, f"weather_data_{current_date}.csv")
+                        new_file = not os.path.exists(csv_file)
+                        self.csv_fh = open(csv_file, 'a', newline='', buffering=1 << 16)
+                        self.csv_writer = csv.writer(self.csv_fh)
+                        if new_file:
+                            self.csv_writer.writerow(CSV_COLUMNS)
+                        self.csv_date = current_date
+                        self.cleanup_old_csv()
+                    self.csv_writer.writerows([self.csv_row(data) for data in batch])
+                    self.csv_fh.flush()
+                except Exception as e:
+                    self.log(f"CSV write error: {e}", level=logging.ERROR)
+                    self.close_csv()  # Reopen cleanly on the next batch
+        finally:
+            self.close_csv()
+
+    def csv_row(self, data):
+        """Build one CSV row from a queued sensor snapshot"""
+        get = data.get
+        return [get(column, '') for column in CSV_COLUMNS]
+
+    def close_csv(self):
+        """Close the current day's CSV handle, if open"""
+        if self.csv_fh is not None:
             try:
-                data = self.data_queue.get(timeout=1)
-                current_date = datetime.now().strftime('%Y-%m-%d')
-                csv_file = os.path.join(self.csv_dir, f"weather_data_{current_date}.csv")
-                if not os.path.exists(csv_file):
-                    with open(csv_file, 'w') as f:
-                        writer = csv.writer(f)
-                        writer.writerow([
-                            'timestamp', 'temperature', 'humidity', 'pressure', 'uv_index',
-                            'co2', 'formaldehyde', 'tvoc', 'pm2_5', 'pm10',
-                            'aqi_temperature', 'aqi_humidity',
-                            'wind_speed', 'wind_dir_degrees', 'wind_dir_cardinal',
-                            'rainfall'
-                        ])
-                    self.cleanup_old_csv()
-                with open(csv_file, 'a') as f:
-                    writer = csv.writer(f)
-                    writer.writerow([
-                        data['timestamp'],
-                        data.get('temperature', ''),
-                        data.get('humidity', ''),
-                        data.get('pressure', ''),
-                        data.get('uv_index', ''),
-                        data.get('co2', ''),
-                        data.get('formaldehyde', ''),
-                        data.get('tvoc', ''),
-                        data.get('pm2_5', ''),
-                        data.get('pm10', ''),
-                        data.get('aqi_temperature', ''),
-                        data.get('aqi_humidity', ''),
-                        data.get('wind_speed', ''),
-                        data.get('wind_dir_degrees', ''),
-                        data.get('wind_dir_cardinal', ''),
-                        data.get('rainfall', '')
-                    ])
-            except queue.Empty:
-                continue
-            except Exception as e:
-                self.log(f"CSV write error: {e}", level=logging.ERROR)
+                self.csv_fh.close()
+            except OSError as e:
+                self.log(f"Error closing CSV file: {e}", level=logging.ERROR)
+        self.csv_date = None
+        self.csv_fh = None
+        self.csv_writer = None
 
     def log_sensor_data(self, sensor_name, data):
         """Log sensor data in appropriate format"""
+        # Called for every sensor every second; skip all formatting when INFO is filtered out
+        if not self.logger or not self.logger.isEnabledFor(logging.INFO):
+            return
         if sensor_name == 'environment':
-            self.log(f"Env: {data['temperature']:.1f}°C, {data['humidity']:.1f}%, {data['pressure']:.1f}hPa")
+            self.log("Env: %.1f°C, %.1f%%, %.1fhPa", data['temperature'], data['humidity'], data['pressure'])
         elif sensor_name == 'uv':
-            self.log(f"UV: {data['uv_index']:.2f}")
+            self.log("UV: %.2f", data['uv_index'])
         elif sensor_name == 'aqi':
-            self.log(f"AQI Sensor Data: {data}")
+            self.log("AQI Sensor Data: %s", data)
         elif sensor_name == 'wind_speed':
-            self.log(f"Wind Speed: {data['wind_speed']:.1f} m/s")
+            self.log("Wind Speed: %.1f m/s", data['wind_speed'])
         elif sensor_name == 'wind_direction':
-            self.log(f"Wind Direction: {data['wind_dir_degrees']}° ({data['wind_dir_cardinal']})")
+            self.log("Wind Direction: %s° (%s)", data['wind_dir_degrees'], data['wind_dir_cardinal'])
         elif sensor_name == 'rainfall':
-            self.log(f"Raw Rainfall Reading: {data['rainfall']:.1f} mm")
+            self.log("Raw Rainfall Reading: %.1f mm", data['rainfall'])
+
+    def _read_registers(self, sensor, count, address=0x0000):
+        """Read holding registers from a sensor, flagging the link for reconnect if it has dropped"""
+        try:
+            return self.modbus_client.read_holding_registers(
+                address=address,
+                count=count,
+                slave=self.config['sensors'][sensor]
+            )
+        except ConnectionException:
+            self.modbus_needs_reconnect = True
+            raise
 
     def read_environment_sensor(self):
         """Read temperature, humidity, and pressure"""
         try:
-            result = self.modbus_client.read_holding_registers(
-                address=0x0000,
-                count=3,
-                slave=self.config['sensors']['environment']
-            )
+            result = self._read_registers('environment', 3)
             if result.isError():
                 return None
             return {
@@ -306,11 +505,7 @@ class DataManager:
     def read_uv_sensor(self):
         """Read UV index"""
         try:
-            result = self.modbus_client.read_holding_registers(
-                address=0x0000,
-                count=1,
-                slave=self.config['sensors']['uv']
-            )
+            result = self._read_registers('uv', 1)
             if result.isError():
                 return {'uv_index': 0.0}
             return {'uv_index': result.registers[0] / 100.0}
@@ -318,31 +513,45 @@ class DataManager:
             self.log(f"UV sensor error: {e}", level=logging.ERROR)
             return {'uv_index': 0.0}
 
+    def load_aqi_table(self, csv_path):
+        """Parse the AQI CSV into sorted wall-clock seconds and per-row float dicts"""
+        entries = []
+        with open(csv_path, 'r', newline='') as file:
+            for row in csv.DictReader(file):
+                # Drop the UTC offset but keep the local wall time the row was recorded in
+                stamp = datetime.fromisoformat(row['date']).replace(tzinfo=None)
+                values = {}
+                for key, column in AQI_CSV_COLUMNS:
+                    value = row.get(column)
+                    values[key] = float(value) if value else math.nan
+                entries.append((wall_clock_seconds(stamp), values))
+        entries.sort(key=lambda entry: entry[0])
+        return [entry[0] for entry in entries], [entry[1] for entry in entries]
+
     def read_aqi_sensor(self):
-        """Read AQI data from CSV file"""
+        """Read AQI data for the row closest to now from the CSV file"""
         try:
-            current_time = datetime.now()
             csv_path = os.path.join(os.path.dirname(__file__), 'aqi', 'karachi_aqi_data_with_pst.csv')
-            if not os.path.exists(csv_path):
+            try:
+                mtime = os.stat(csv_path).st_mtime
+            except FileNotFoundError:
                 self.log(f"AQI data file not found: {csv_path}", level=logging.ERROR)
                 return None
-            try:
-                df = pd.read_csv(csv_path)
-                df['date'] = pd.to_datetime(df['date']).dt.tz_localize(None)
-                closest_time_row = df.iloc[(df['date'] - current_time).abs().argsort()[0]]
-                data = {
-                    'co2': float(closest_time_row['carbon_dioxide']),
-                    'pm2_5': float(closest_time_row['pm2_5']),
-                    'pm10': float(closest_time_row['pm10']),
-                    'carbon_monoxide': float(closest_time_row['carbon_monoxide']),
-                    'nitrogen_dioxide': float(closest_time_row['nitrogen_dioxide']),
-                    'sulphur_dioxide': float(closest_time_row['sulphur_dioxide']),
-                    'ozone': float(closest_time_row['ozone'])
-                }
-                return data
-            except pd.errors.EmptyDataError:
-                self.log("AQI data file is empty", level=logging.ERROR)
+            cache = self.aqi_cache
+            if cache['mtime'] != mtime:
+                cache['ts'], cache['rows'] = self.load_aqi_table(csv_path)
+                cache['mtime'] = mtime
+                if not cache['ts']:
+                    self.log("AQI data file is empty", level=logging.ERROR)
+            ts = cache['ts']
+            if not ts:
                 return None
+            now_s = wall_clock_seconds(datetime.now())
+            idx = bisect.bisect_left(ts, now_s)
+            # Nearest of the neighbours either side of the insertion point
+            if idx == len(ts) or (idx > 0 and now_s - ts[idx - 1] <= ts[idx] - now_s):
+                idx -= 1
+            return cache['rows'][idx]
         except Exception as e:
             self.log(f"Error reading AQI data from CSV: {e}", level=logging.ERROR)
             return None
@@ -350,11 +559,7 @@ class DataManager:
     def read_wind_speed(self):
         """Read wind speed in m/s"""
         try:
-            result = self.modbus_client.read_holding_registers(
-                address=0x0000,
-                count=1,
-                slave=self.config['sensors']['wind_speed']
-            )
+            result = self._read_registers('wind_speed', 1)
             if result.isError():
                 return {'wind_speed': 0.0}
             return {'wind_speed': result.registers[0] / 10.0}
@@ -365,11 +570,7 @@ class DataManager:
     def read_wind_direction(self):
         """Read wind direction in degrees and cardinal direction"""
         try:
-            result = self.modbus_client.read_holding_registers(
-                address=0x0000,
-                count=3,
-                slave=self.config['sensors']['wind_direction']
-            )
+            result = self._read_registers('wind_direction', 3)
             if result.isError():
                 return None
             reg_0 = result.registers[0]
@@ -390,21 +591,13 @@ class DataManager:
         """Convert degrees to cardinal direction (16-point compass)"""
         if degrees is None or not (0 <= degrees <= 360):
             return "Unknown"
-        directions = [
-            "N", "NNE", "NE", "ENE", "E", "ESE", "SE", "SSE",
-            "S", "SSW", "SW", "WSW", "W", "WNW", "NW", "NNW"
-        ]
-        index = round(degrees / (360. / len(directions))) % len(directions)
-        return directions[index]
+        # Integer rounding to the nearest sector; & 15 wraps 360 back to N
+        return CARDINAL_DIRECTIONS[((int(degrees) * 16 + 180) // 360) & 15]
 
     def read_rainfall(self):
         """Read rainfall in mm"""
         try:
-            result = self.modbus_client.read_holding_registers(
-                address=0,
-                count=1,
-                slave=self.config['sensors']['rainfall']
-            )
+            result = self._read_registers('rainfall', 1)
             if result.isError():
                 return None
             return {'rainfall': result.registers[0] / 10.0}
@@ -412,24 +605,43 @@ class DataManager:
             self.log(f"Rainfall sensor error: {e}", level=logging.ERROR)
             return None
 
-    def get_sun_info(self):
-        """Get sunrise and sunset times for Karachi"""
+    def get_sun_info(self, now=None):
+        """Get sunrise and sunset times for Karachi (shared dict; do not modify)"""
         try:
-            current_date = datetime.now().strftime('%m-%d')
+            if now is None:
+                now = datetime.now()
+            current_date = f"{now.month:02d}-{now.day:02d}"
             sun_data_file = os.path.join('awos_assit_code', 'karachi_sun_data.csv')
-            if not os.path.exists(sun_data_file):
+            try:
+                mtime = os.stat(sun_data_file).st_mtime
+            except FileNotFoundError:
                 self.log(f"Sun data file not found: {sun_data_file}", level=logging.WARNING)
-                return {'sunrise': '06:00', 'sunset': '18:00'}
-            with open(sun_data_file, 'r') as file:
-                csv_reader = csv.DictReader(file)
-                for row in csv_reader:
-                    if row['date'] == current_date:
-                        return {'sunrise': row['sunrise'], 'sunset': row['sunset']}
+                return DEFAULT_SUN_INFO
+            cache = self.sun_cache
+            if cache['mtime'] != mtime:
+                # Times are parsed here, once per file load, not on every lookup; a bad
+                # row only loses its own day (which then falls back to the default)
+                table = {}
+                with open(sun_data_file, 'r') as file:
+                    for row in csv.DictReader(file):
+                        try:
+                            table[row['date']] = sun_entry(row['sunrise'], row['sunset'])
+                        except (KeyError, TypeError, ValueError) as e:
+                            self.log(f"Skipping bad sun data row {row}: {e}", level=logging.WARNING)
+                cache['table'] = table
+                cache['mtime'] = mtime
+            sun_info = cache['table'].get(current_date)
+            if sun_info is not None:
+                return sun_info
             self.log(f"No sun data found for date: {current_date}", level=logging.WARNING)
-            return {'sunrise': '06:00', 'sunset': '18:00'}
+            return DEFAULT_SUN_INFO
         except Exception as e:
             self.log(f"Error reading sun data: {e}", level=logging.ERROR)
-            return {'sunrise': '06:00', 'sunset': '18:00'}
+            return DEFAULT_SUN_INFO
+
+    def snapshot(self):
+        """Read-only view of the latest published readings (never changes after it is returned)"""
+        return MappingProxyType(self.sensor_data)
 
     def start(self):
         """Start data collection threads"""
@@ -443,32 +655,61 @@ class DataManager:
         """Stop data collection threads"""
         self.running = False
         self.sensor_thread.join(timeout=2)
+        self.data_ready.set()  # Wake the CSV writer so it notices running is False
         self.csv_thread.join(timeout=2)
         if self.modbus_client and self.modbus_client.is_socket_open():
             self.modbus_client.close()
+        if self.log_listener:
+            self.log_listener.stop()  # Writes out whatever is still queued
+            self.log_listener = None
 
 class WeatherStationSystem:
+    # Mapping-mode click markers stay up this long and are cleared in batches
+    MARKER_LIFETIME_S = 2.0
+    MARKER_SWEEP_MS = 500
+    MARKER_LIMIT = 20  # Rapid clicking evicts the oldest marker beyond this many
+    # Log housekeeping is only due once the date changes, so check_log_rotation sleeps
+    # until just after midnight; the cap bounds how late a wall-clock jump can make it
+    LOG_CHECK_MIN_MS = 60000
+    LOG_CHECK_MAX_MS = 6 * 3600000
+
     def __init__(self, root, data_manager, display_config):
         self.root = root
         self.data_manager = data_manager
         self.display_config = display_config
         self.root.title(f"Weather Station Dashboard - {display_config.get('id', 'Night')}")
-        self.root.after(1000, self._keep_focus)
+        self.after_ids = {}  # Latest after() id per periodic task, so cancel_timers can stop them
+        self.schedule('keep_focus', 1000, self._keep_focus)
         self.config = data_manager.config
+        self.update_interval_ms = self.config['gui']['update_interval']
         self.log = data_manager.log
+        # Per-item text/fill last sent to the canvas
+        self.last_text = {}
+        self.last_fill = {}
+        self.last_static_day = None  # Date the day/date/sun labels were last drawn for
+        self.last_state_inputs = None  # state_keys values the state labels were drawn for
+        self.datetime_cache_key = None
+        self.datetime_cache = None
+        # The timer chain runs update_display on a fixed monotonic grid; forced refreshes
+        # and display switches call update_display directly and leave the chain alone
+        self.display_deadline = time.monotonic()
+        self.display_after_id = None
+        self.visible = True  # GUIManager hides pre-built displays; hidden ones skip refresh work
         self.setup_gui()
         self.init_sensor_config()
         self.update_display()
+        self.schedule_display_update()
         self.update_static_elements()
         self.root.bind('<Escape>', lambda e: self.shutdown())
         self.root.bind('<F12>', self.toggle_mapping_mode)
         self.root.bind('<F5>', lambda e: self.force_update())
-        self.root.after(3600000, self.check_log_rotation)
+        self.schedule('log_rotation', self.log_check_delay_ms(), self.check_log_rotation)
 
     def _keep_focus(self):
         """Periodically bring window to front to fight popups"""
-        self.root.lift()
-        self.root.after(1000, self._keep_focus)
+        if self.visible:
+            self.root.lift()
+        self.schedule('keep_focus', 1000, self._keep_focus)
 
     def setup_gui(self):
         """Initialize the graphical user interface"""
@@ -483,8 +724,7 @@ class WeatherStationSystem:
             if not os.path.exists(bg_path):
                 self.log(f"Background image not found at: {bg_path}", level=logging.ERROR)
                 raise FileNotFoundError(f"Background image not found: {bg_path}")
-            img = Image.open(bg_path)
-            img = img.resize((screen_width, screen_height), Image.Resampling.LANCZOS)
+            img = self.load_background_image(bg_path, screen_width, screen_height)
             self.bg_image = ImageTk.PhotoImage(img)
             self.bg_canvas = tk.Canvas(
                 self.main_frame,
@@ -504,7 +744,59 @@ class WeatherStationSystem:
             raise
         self.create_display_widgets()
         self.mapping_mode = False
-        self.coordinate_text = None
+        # Mapping-mode indicator, created once and shown/hidden by toggle_mapping_mode
+        self.coordinate_text = self.bg_canvas.create_text(
+            10, 10,
+            text="Mapping Mode ON (Click to see coordinates)",
+            fill='red',
+            anchor='nw',
+            state='hidden'
+        )
+        # (expiry, marker, text) for mapping-mode clicks, oldest first, cleared by sweep_markers
+        self.pending_markers = deque(maxlen=self.MARKER_LIMIT)
+        self.marker_sweep_id = None
+        # Bound once; clicks only do something while mapping mode is on
+        self.bg_canvas.bind('<Button-1>', self._on_click)
+
+    def load_background_image(self, bg_path, width, height):
+        """Return the background resized to the screen, reusing a cached copy from a previous start"""
+        name = os.path.splitext(os.path.basename(bg_path))[0]
+        src_mtime = int(os.path.getmtime(bg_path))
+        cache_path = os.path.join(
+            os.path.dirname(bg_path), f".cache_{name}_{width}x{height}_{src_mtime}.png"
+        )
+        if os.path.exists(cache_path):
+            try:
+                img = Image.open(cache_path)
+                img.load()  # Decode now rather than inside PhotoImage
+                return img
+            except OSError as e:
+                self.log(f"Ignoring unreadable background cache {cache_path}: {e}", level=logging.WARNING)
+        img = Image.open(bg_path)
+        img = img.resize((width, height), Image.Resampling.LANCZOS)
+        try:
+            # Write to a temp name first so a crash never leaves a truncated cache behind
+            tmp_path = cache_path + '.tmp'
+            img.save(tmp_path, format='PNG', optimize=True)
+            os.replace(tmp_path, cache_path)
+        except OSError as e:
+            self.log(f"Could not cache resized background: {e}", level=logging.WARNING)
+        else:
+            self.remove_stale_background_caches(cache_path, name)
+        return img
+
+    def remove_stale_background_caches(self, keep_path, name):
+        """Delete this image's cached copies for other sizes or older versions of the source"""
+        prefix = f".cache_{name}_"
+        for path in glob.glob(os.path.join(os.path.dirname(keep_path), glob.escape(prefix) + "*.png")):
+            # Only <W>x<H>_<mtime>.png after the prefix, so another image whose name
+            # starts with this one's isn't caught
+            if path == keep_path or len(os.path.basename(path)[len(prefix):-4].split('_')) != 2:
+                continue
+            try:
+                os.remove(path)
+            except OSError as e:
+                self.log(f"Could not remove stale background cache {path}: {e}", level=logging.WARNING)
 
     def create_display_widgets(self):
         """Create all GUI display widgets"""
@@ -581,126 +873,157 @@ class WeatherStationSystem:
                 'widget': 'aqi_value'
             }
         }
+        # Resolve each sensor's canvas item, parser and formatter once for update_display
+        self.render_plan = [
+            (getattr(self, config['widget']), config['parser'], config['display_format'])
+            for config in self.sensor_configs.values()
+        ]
+        # One updater per state label: sensor_data key, (label, colour) classifier,
+        # and the value/state canvas items it colours
+        state_plan = (
+            ('humidity', humidity_state, self.humidity_value, self.humidity_state_value),
+            ('uv_index', uv_state, self.uv_value, self.uv_state_value),
+            ('pm2_5', lambda v: aqi_state(self.data_manager.calculate_aqi(v)), self.aqi_value, self.aqi_state_value)
+        )
+        self.state_keys = tuple(entry[0] for entry in state_plan)
+        self.state_updaters = tuple(self.make_state_updater(*entry) for entry in state_plan)
+
+    def make_state_updater(self, key, classify, value_item, state_item):
+        """Closure adding one sensor's state label changes to the pending list"""
+        def update(data, pending):
+            value = data.get(key)
+            if value is None:
+                pending.append((state_item, *NO_STATE))
+                return
+            label, color = classify(value)
+            pending.append((value_item, None, color))
+            pending.append((state_item, label, color))
+        return update
 
     def get_aqi_state(self, aqi):
         """Determine AQI state and color"""
-        if aqi is None:
-            return "N/A", "#FFFFFF"
-        aqi_float = float(aqi)
-        if 0.0 <= aqi_float <= 50.0:
-            return "GOOD", "#39FF14"
-        elif 50.1 <= aqi_float <= 100.0:
-            return "MODERATE", "#FFFF00"
-        elif 100.1 <= aqi_float <= 150.0:
-            return "UNHEALTHY", "#FF7E00"
-        elif 150.1 <= aqi_float <= 200.0:
-            return "UNHEALTHY", "#FF0000"
-        elif 200.1 <= aqi_float <= 300.0:
-            return "VERY UNHEALTHY", "#8F3F97"
-        else:
-            return "HAZARDOUS", "#7E0023"
+        return aqi_state(aqi)
 
     def get_uv_state(self, uv):
         """Determine UV state and color"""
-        if uv is None:
-            return "N/A", "#FFFFFF"
-        uv_float = float(uv)
-        if 0.0 <= uv_float <= 2.0:
-            return "LOW", "#39FF14"
-        elif 2.1 <= uv_float <= 5.0:
-            return "MODERATE", "#FFFF00"
-        elif 5.1 <= uv_float <= 7.0:
-            return "HIGH", "#FF7E00"
-        elif 7.1 <= uv_float <= 10.0:
-            return "VERY HIGH", "#FF0000"
-        else:
-            return "EXTREME", "#8F3F97"
+        return uv_state(uv)
 
     def get_humidity_state(self, humidity):
         """Determine humidity state and color"""
-        if humidity is None:
-            return "N/A", "#FFFFFF"
-        humidity_float = float(humidity)
-        if 0.0 <= humidity_float <= 30.0:
-            return "LOW", "#3EC1EC"
-        elif 30.1 <= humidity_float <= 50.0:
-            return "NORMAL", "#39FF14"
-        elif 50.1 <= humidity_float <= 60.0:
-            return "SLIGHTLY HIGH", "#FFFF00"
-        elif 60.1 <= humidity_float <= 70.0:
-            return "HIGH", "#FF7E00"
-        else:
-            return "VERY HIGH", "#FF0000"
+        return humidity_state(humidity)
 
     def update_static_elements(self):
         """Update date, time and sun information"""
-        datetime_info = self.get_datetime_info()
-        sun_info = self.data_manager.get_sun_info()
-        self.bg_canvas.itemconfig(self.current_day_value, text=datetime_info['day'])
-        self.bg_canvas.itemconfig(self.current_date_value, text=datetime_info['date'])
+        now = datetime.now()
+        datetime_info = self.get_datetime_info(now)
         self.bg_canvas.itemconfig(self.current_time_value, text=datetime_info['time'])
-        self.bg_canvas.itemconfig(self.sunrise_value, text=f"↑{sun_info['sunrise']}")
-        self.bg_canvas.itemconfig(self.sunset_value, text=f"↓{sun_info['sunset']}")
-        self.root.after(60000, self.update_static_elements)
+        # Day, date and sun times only change at midnight
+        today = now.date()
+        if today != self.last_static_day:
+            sun_info = self.data_manager.get_sun_info(now)
+            self.bg_canvas.itemconfig(self.current_day_value, text=datetime_info['day'])
+            self.bg_canvas.itemconfig(self.current_date_value, text=datetime_info['date'])
+            self.bg_canvas.itemconfig(self.sunrise_value, text=f"↑{sun_info['sunrise']}")
+            self.bg_canvas.itemconfig(self.sunset_value, text=f"↓{sun_info['sunset']}")
+            self.last_static_day = today
+        self.schedule('static_elements', 60000, self.update_static_elements)
 
-    def update_display(self):
+    def update_display(self, flush=True):
         """Update all display elements with current sensor data"""
+        if not self.visible:
+            return
         try:
-            for sensor_name, config in self.sensor_configs.items():
-                value = config['parser'](self.data_manager.sensor_data)
-                widget = getattr(self, config['widget'])
-                formatted_value = config['display_format'](value)
-                self.bg_canvas.itemconfig(widget, text=formatted_value)
-            self.update_state_displays()
+            # One snapshot for the whole refresh so every widget shows the same reading
+            data = self.data_manager.snapshot()
+            set_text = self._set_text
+            for widget, parser, display_format in self.render_plan:
+                set_text(widget, display_format(parser(data)))
+            self.update_state_displays(data)
+            # Single redraw for everything changed this tick (never a full update())
+            if flush:
+                self.bg_canvas.update_idletasks()
         except Exception as e:
             self.log(f"Display update error: {e}", level=logging.ERROR)
-        self.root.after(self.config['gui']['update_interval'], self.update_display)
 
-    def update_state_displays(self):
+    def set_visible(self, visible):
+        """Show or hide this display; a display being shown is refreshed straight away"""
+        self.visible = visible
+        if visible:
+            self.root.deiconify()
+            self.update_display()
+        else:
+            self.root.withdraw()
+
+    def schedule_display_update(self):
+        """Arm the next tick on the interval grid; only the timer chain itself calls this"""
+        now = time.monotonic()
+        self.display_deadline += self.update_interval_ms / 1000.0
+        if self.display_deadline <= now:
+            self.display_deadline = now  # Fell a whole interval behind; resync rather than burst
+        delay_ms = max(1, int((self.display_deadline - now) * 1000))
+        self.display_after_id = self.root.after(delay_ms, self.run_scheduled_display_update)
+
+    def run_scheduled_display_update(self):
+        """Timer entry point for update_display"""
+        self.display_after_id = None
+        self.update_display()
+        self.schedule_display_update()
+
+    def update_state_displays(self, data=None):
         """Update state displays with appropriate colors"""
         try:
-            humidity = self.data_manager.sensor_data.get('humidity')
-            if humidity is not None:
-                hum_state, hum_color = self.get_humidity_state(humidity)
-                self.bg_canvas.itemconfig(self.humidity_value, fill=hum_color)
-                self.bg_canvas.itemconfig(self.humidity_state_value, text=hum_state, fill=hum_color)
-            else:
-                self.bg_canvas.itemconfig(self.humidity_state_value, text="N/A", fill="#FFFFFF")
-            uv = self.data_manager.sensor_data.get('uv_index')
-            if uv is not None:
-                uv_state, uv_color = self.get_uv_state(uv)
-                self.bg_canvas.itemconfig(self.uv_value, fill=uv_color)
-                self.bg_canvas.itemconfig(self.uv_state_value, text=uv_state, fill=uv_color)
-            else:
-                self.bg_canvas.itemconfig(self.uv_state_value, text="N/A", fill="#FFFFFF")
-            pm2_5 = self.data_manager.sensor_data.get('pm2_5')
-            if pm2_5 is not None:
-                aqi = self.data_manager.calculate_aqi(pm2_5)
-                aqi_state, aqi_color = self.get_aqi_state(aqi)
-                self.bg_canvas.itemconfig(self.aqi_value, fill=aqi_color)
-                self.bg_canvas.itemconfig(self.aqi_state_value, text=aqi_state, fill=aqi_color)
-            else:
-                self.bg_canvas.itemconfig(self.aqi_state_value, text="N/A", fill="#FFFFFF")
+            if data is None:
+                data = self.data_manager.snapshot()
+            inputs = tuple(map(data.get, self.state_keys))
+            if inputs == self.last_state_inputs:
+                return  # Same readings as last time, so the same labels and colours
+            # Pass 1: work out every (item, text, fill) change
+            pending = []
+            for update in self.state_updaters:
+                update(data, pending)
+            # Pass 2: push them to the canvas back to back (unchanged ones are skipped)
+            for item, text, fill in pending:
+                if text is None:
+                    self._set_fill(item, fill)
+                else:
+                    self._set_text_fill(item, text, fill)
+            self.last_state_inputs = inputs
         except Exception as e:
             self.log(f"Error updating state displays: {e}", level=logging.ERROR)
 
+    def _set_text(self, item, text):
+        """itemconfig text unless already shown"""
+        if self.last_text.get(item) != text:
+            self.bg_canvas.itemconfig(item, text=text)
+            self.last_text[item] = text
+
+    def _set_fill(self, item, fill):
+        """itemconfig fill unless already shown"""
+        if self.last_fill.get(item) != fill:
+            self.bg_canvas.itemconfig(item, fill=fill)
+            self.last_fill[item] = fill
+
+    def _set_text_fill(self, item, text, fill):
+        """itemconfig only whichever of text/fill differs"""
+        options = {}
+        if self.last_text.get(item) != text:
+            options['text'] = text
+            self.last_text[item] = text
+        if self.last_fill.get(item) != fill:
+            options['fill'] = fill
+            self.last_fill[item] = fill
+        if options:
+            self.bg_canvas.itemconfig(item, **options)
+
     def toggle_mapping_mode(self, event=None):
         """Toggle coordinate mapping mode"""
         self.mapping_mode = not self.mapping_mode
+        self.bg_canvas.itemconfig(self.coordinate_text, state='normal' if self.mapping_mode else 'hidden')
+
+    def _on_click(self, event):
+        """Canvas click handler"""
         if self.mapping_mode:
-            self.bg_canvas.bind('<Button-1>', self.show_coordinates)
-            if self.coordinate_text:
-                self.bg_canvas.delete(self.coordinate_text)
-            self.coordinate_text = self.bg_canvas.create_text(
-                10, 10,
-                text="Mapping Mode ON (Click to see coordinates)",
-                fill='red',
-                anchor='nw'
-            )
-        else:
-            self.bg_canvas.unbind('<Button-1>')
-            if self.coordinate_text:
-                self.bg_canvas.delete(self.coordinate_text)
+            self.show_coordinates(event)
 
     def show_coordinates(self, event):
         """Display coordinates where user clicked"""
@@ -716,34 +1039,97 @@ class WeatherStationSystem:
             fill='red',
             anchor='w'
         )
-        self.root.after(2000, lambda: self.bg_canvas.delete(marker, text))
+        if len(self.pending_markers) == self.MARKER_LIMIT:
+            _, old_marker, old_text = self.pending_markers[0]  # Dropped by the append below
+            self.bg_canvas.delete(old_marker, old_text)
+        self.pending_markers.append((time.monotonic() + self.MARKER_LIFETIME_S, marker, text))
+        if self.marker_sweep_id is None:
+            self.marker_sweep_id = self.root.after(self.MARKER_SWEEP_MS, self.sweep_markers)
+
+    def sweep_markers(self):
+        """Delete every expired click marker in one canvas call; reschedule while any remain"""
+        self.marker_sweep_id = None
+        now = time.monotonic()
+        expired = []
+        while self.pending_markers and self.pending_markers[0][0] <= now:
+            _, marker, text = self.pending_markers.popleft()
+            expired.append(marker)
+            expired.append(text)
+        if expired:
+            self.bg_canvas.delete(*expired)
+        if self.pending_markers:
+            self.marker_sweep_id = self.root.after(self.MARKER_SWEEP_MS, self.sweep_markers)
+
+    def schedule(self, name, delay_ms, callback):
+        """root.after() under `name`, replacing any callback still pending there"""
+        after_id = self.after_ids.get(name)
+        if after_id is not None:
+            self.root.after_cancel(after_id)  # No-op if it has already run
+        self.after_ids[name] = self.root.after(delay_ms, callback)
+
+    def cancel_timers(self):
+        """Cancel every pending after() callback of this display"""
+        for after_id in self.after_ids.values():
+            self.root.after_cancel(after_id)
+        self.after_ids.clear()
+        if self.display_after_id is not None:
+            self.root.after_cancel(self.display_after_id)
+            self.display_after_id = None
+        if self.marker_sweep_id is not None:
+            self.root.after_cancel(self.marker_sweep_id)
+            self.marker_sweep_id = None
 
     def shutdown(self):
         """Clean shutdown of the system"""
         self.log(f"Shutting down display {self.display_config.get('id', 'Night')}")
+        self.cancel_timers()
         self.root.destroy()
 
-    def get_datetime_info(self):
-        """Get current date and time information"""
-        now = datetime.now()
-        return {
-            'day': now.strftime('%A').upper(),
-            'date': now.strftime('%d %b').replace(now.strftime('%b'), now.strftime('%b').upper()) + now.strftime(' %Y'),
-            'time': now.strftime('%H:%M')
+    def get_datetime_info(self, now=None):
+        """Get current date and time information (for `now` if the caller already has it), cached per minute"""
+        if now is None:
+            now = datetime.now()
+        key = (now.year, now.month, now.day, now.hour, now.minute)
+        if key == self.datetime_cache_key:
+            return self.datetime_cache
+        day_name, month = now.strftime('%A|%b').upper().split('|')
+        self.datetime_cache = {
+            'day': day_name,
+            'date': f"{now.day:02d} {month} {now.year}",
+            'time': f"{now.hour:02d}:{now.minute:02d}"
         }
+        self.datetime_cache_key = key
+        return self.datetime_cache
 
     def force_update(self):
         """Force immediate update of all display elements"""
-        self.update_display()
+        self.last_text.clear()
+        self.last_fill.clear()
+        self.last_static_day = None  # Redraw day/date/sun too
+        self.last_state_inputs = None
+        self.update_display(flush=False)
         self.update_static_elements()
+        self.bg_canvas.update_idletasks()  # One redraw covering both passes
         self.log("Display manually refreshed", level=logging.INFO)
 
     def check_log_rotation(self):
         """Periodic check for log rotation"""
         self.data_manager.check_and_rotate_logs()
-        self.root.after(3600000, self.check_log_rotation)
+        self.schedule('log_rotation', self.log_check_delay_ms(), self.check_log_rotation)
+
+    def log_check_delay_ms(self, now=None):
+        """Milliseconds until just after the next midnight, clamped to the check bounds"""
+        now = now or datetime.now()
+        midnight = datetime.combine(now.date() + timedelta(days=1), datetime.min.time())
+        delay_ms = int((midnight - now).total_seconds() * 1000) + self.LOG_CHECK_MIN_MS
+        return min(self.LOG_CHECK_MAX_MS, max(self.LOG_CHECK_MIN_MS, delay_ms))
 
 class GUIManager:
+    # check_display_time sleeps until the next transition, plus a small cushion so it
+    # wakes just after it, but never longer than the cap
+    BOUNDARY_CUSHION_S = 0.5
+    MAX_CHECK_INTERVAL_S = 3600
+
     def __init__(self, data_manager, display_configs):
         self.data_manager = data_manager
         self.display_configs = display_configs
@@ -753,27 +1139,50 @@ class GUIManager:
         self.apps = {}
         self.day_display_index = 0
         self.toggle_time_start = time.time()
+        # Day toggle cycle is fixed by config, so work out its shape once
+        self.day_displays = ('day1', 'day2')
+        self.toggle_durations = tuple(
+            display_configs[display_id]['display_duration'] for display_id in self.day_displays
+        )
+        self.total_cycle = sum(self.toggle_durations)
+        self.first_toggle_end = self.toggle_durations[0]
         self.running = True
+        self.check_after_id = None
+        # Build every display at startup so the first sunrise/sunset switch doesn't stall
+        for display_id in ('night',) + self.day_displays:
+            self.precreate_display(display_id)
         self.check_display_time()
 
     def check_display_time(self):
-        """Check current time and update display accordingly"""
+        """Show the right display now, then sleep until the next sunrise/sunset or day toggle"""
         try:
-            sun_info = self.data_manager.get_sun_info()
-            sunrise = datetime.strptime(sun_info['sunrise'], '%H:%M').time()
-            sunset = datetime.strptime(sun_info['sunset'], '%H:%M').time()
-            current_time = datetime.now().time()
+            now = datetime.now()
+            sun_info = self.data_manager.get_sun_info(now)
+            sunrise = sun_info['sunrise_time']
+            sunset = sun_info['sunset_time']
+            current_time = now.time()
             is_daytime = sunrise <= current_time < sunset
 
             if is_daytime:
-                self.handle_day_display()
+                until_toggle = self.handle_day_display()
+                until_boundary = (datetime.combine(now.date(), sunset) - now).total_seconds()
+                delay = min(until_toggle, until_boundary)
             else:
                 self.handle_night_display()
+                if current_time < sunrise:
+                    next_sunrise = datetime.combine(now.date(), sunrise)
+                else:
+                    tomorrow = now + timedelta(days=1)
+                    tomorrow_info = self.data_manager.get_sun_info(tomorrow)
+                    next_sunrise = datetime.combine(tomorrow.date(), tomorrow_info['sunrise_time'])
+                delay = (next_sunrise - now).total_seconds()
 
-            self.root.after(5000, self.check_display_time)  # Check every 5 seconds
+            # Land just past the boundary; the cap re-checks regularly in case the wall clock jumps
+            delay = min(delay + self.BOUNDARY_CUSHION_S, self.MAX_CHECK_INTERVAL_S)
+            self.check_after_id = self.root.after(max(1000, int(delay * 1000)), self.check_display_time)
         except Exception as e:
             self.data_manager.log(f"Error checking display time: {e}", level=logging.ERROR)
-            self.root.after(5000, self.check_display_time)
+            self.check_after_id = self.root.after(5000, self.check_display_time)
 
     def handle_night_display(self):
         """Show night display (GUI 1)"""
@@ -784,54 +1193,61 @@ class GUIManager:
             self.create_display('night')
 
     def handle_day_display(self):
-        """Toggle between day displays (GUI 2 and GUI 3)"""
-        day_displays = ['day1', 'day2']
-        toggle_durations = [
-            self.display_configs['day1']['display_duration'],
-            self.display_configs['day2']['display_duration']
-        ]
-        elapsed = time.time() - self.toggle_time_start
-        total_cycle = sum(toggle_durations)
-        cycle_position = elapsed % total_cycle
-        current_index = 0
-        cumulative_duration = 0
-        for i, duration in enumerate(toggle_durations):
-            cumulative_duration += duration
-            if cycle_position < cumulative_duration:
-                current_index = i
-                break
-        if self.current_display != day_displays[current_index]:
-            self.data_manager.log(f"Switching to {day_displays[current_index]} display")
+        """Toggle between day displays (GUI 2 and GUI 3); returns seconds until the next toggle"""
+        cycle_position = (time.time() - self.toggle_time_start) % self.total_cycle
+        if cycle_position < self.first_toggle_end:
+            current_index = 0
+            remaining = self.first_toggle_end - cycle_position
+        else:
+            current_index = 1
+            remaining = self.total_cycle - cycle_position
+        display_id = self.day_displays[current_index]
+        if self.current_display != display_id:
+            self.data_manager.log(f"Switching to {display_id} display")
             self.destroy_current_display()
-            self.current_display = day_displays[current_index]
-            self.create_display(day_displays[current_index])
+            self.current_display = display_id
+            self.create_display(display_id)
+        return remaining
+
+    def precreate_display(self, display_id):
+        """Build a display window up front and keep it hidden until it is needed"""
+        root = tk.Toplevel(self.root)
+        root.withdraw()  # Never mapped while being built, so startup doesn't flash three windows
+        root.wm_attributes("-topmost", True)
+        app = WeatherStationSystem(root, self.data_manager, self.display_configs[display_id])
+        self.apps[display_id] = app
+        root.protocol("WM_DELETE_WINDOW", self.shutdown)
+        app.set_visible(False)
 
     def create_display(self, display_id):
-        """Create a new display instance"""
-        if display_id in self.apps and self.apps[display_id].root.winfo_exists():
-            self.apps[display_id].root.deiconify()
-        else:
-            root = tk.Toplevel(self.root)
-            root.wm_attributes("-topmost", True)
-            app = WeatherStationSystem(root, self.data_manager, self.display_configs[display_id])
-            self.apps[display_id] = app
-            root.protocol("WM_DELETE_WINDOW", self.shutdown)
+        """Show a display, building it first if it does not exist"""
+        if display_id not in self.apps or not self.apps[display_id].root.winfo_exists():
+            self.precreate_display(display_id)
+        app = self.apps[display_id]
+        # -topmost was set once at creation; re-applying it restacks every window, so just raise
+        app.set_visible(True)
+        app.root.lift()
 
     def destroy_current_display(self):
-        """Destroy or hide the current display"""
+        """Hide the current display"""
         if self.current_display and self.current_display in self.apps:
             if self.apps[self.current_display].root.winfo_exists():
-                self.apps[self.current_display].root.withdraw()
+                self.apps[self.current_display].set_visible(False)
 
     def shutdown(self):
         """Shutdown all displays and system"""
+        if not self.running:
+            return  # Already shutting down (e.g. several windows were closed at once)
         self.data_manager.log("Shutting down all displays")
         self.running = False
-        self.destroy_current_display()
+        if self.check_after_id is not None:
+            self.root.after_cancel(self.check_after_id)
+            self.check_after_id = None
         for app in self.apps.values():
             if app.root.winfo_exists():
-                app.shutdown()
+                app.cancel_timers()
         self.data_manager.stop()
+        # The displays are children of the hidden root, so one destroy tears them all down
         self.root.destroy()
 
 if __name__ == "__main__":
@@ -900,26 +1316,28 @@ if __name__ == "__main__":
             config_parser = configparser.ConfigParser()
             if os.path.exists('weather_station.ini'):
                 config_parser.read('weather_station.ini')
+                # (section, key) -> (type to coerce to, dict to store into), taken from the defaults
+                schema = {
+                    (section, key): (type(value), values)
+                    for section, values in config.items()
+                    for key, value in values.items()
+                }
+                # Display sections accept any key; only these are not plain strings
+                display_types = {'display_duration': float}
                 for section in config_parser.sections():
-                    if section in config:
-                        for key in config_parser[section]:
-                            if key in config[section]:
-                                value = config_parser[section][key].strip('"\'')
-                                if isinstance(config[section][key], int):
-                                    config[section][key] = int(value)
-                                elif isinstance(config[section][key], float):
-                                    config[section][key] = float(value)
-                                else:
-                                    config[section][key] = value
-                    elif section.startswith('display_'):
-                        display_id = section.replace('display_', '')
-                        if display_id in display_configs:
-                            for key in config_parser[section]:
-                                value = config_parser[section][key].strip('"\'')
-                                if key == 'display_duration':
-                                    display_configs[display_id][key] = float(value)
-                                else:
-                                    display_configs[display_id][key] = value
+                    items = config_parser[section].items()
+                    if section.startswith('display_'):
+                        target = display_configs.get(section[len('display_'):])
+                        if target is None:
+                            continue
+                        for key, value in items:
+                            target[key] = display_types.get(key, str)(value.strip('"\''))
+                    else:
+                        for key, value in items:
+                            entry = schema.get((section, key))
+                            if entry is not None:
+                                coerce, target = entry
+                                target[key] = coerce(value.strip('"\''))
         except Exception as e:
             print(f"Config load error: {e}. Using defaults.")
 